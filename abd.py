@@ -1,6 +1,8 @@
+import itertools
 import math
+from operator import itemgetter
 from echauffement import *
-from graphviz import Graph
+from gestionnaire import *
 
 
 class abd:
@@ -28,7 +30,7 @@ class abd:
         self.vrai = vrai
      
     @staticmethod
-    def affiche (arbre):
+    def affiche (arbre, rangs=False):
         """
         Affiche un arbre binaire de décision / ROBDD (avec le module graphviz)
 
@@ -36,6 +38,8 @@ class abd:
         ----------
         arbre : abd
             L'arbre à afficher.
+        rangs : bool, optional
+            Aligne les noeuds d'une même variable (cf. lignes_dot()). False par défaut.
 
         Returns
         -------
@@ -44,112 +48,111 @@ class abd:
 
         """
         
-        dot = Graph()
-        def chercher_noeud (noeud, noeuds):
-            """
-            Cherche un noeud dans une liste
+        # Import local : graphviz n'est nécessaire que pour l'affichage
+        from graphviz import Graph
+        return Graph (body=list (abd.lignes_dot (arbre, rangs)))
 
-            Parameters
-            ----------
-            noeud : abd
-                Le noeud à chercher.
-            noeuds : list
-                La liste de noeuds.
-
-            Returns
-            -------
-            string
-                Le code du noeud trouvé (utile pour l'affichage), False sinon .
-            abd
-                Le noeud trouvé, False sinon.
+    @staticmethod
+    def lignes_dot (arbre, rangs=False):
+        """
+        Produit le corps du graphe de l'arbre en langage dot, noeud par noeud, en un seul parcours.
+        Chaque noeud reçoit son identifiant une seule fois : son indice pour une vue_abd
+        ("n" + indice, les noeuds déjà écrits sont marqués dans un bytearray), un numéro
+        attribué dans un dict sinon.
 
-            """
-            
-            for (c, n) in noeuds:
-                if noeud == n:
-                    return (c, n)
-            return (False, False)
-        
-        def ajouter_liens (edges, dot):
-            """
-            Ajoute les liens dans le graphe 
+        Parameters
+        ----------
+        arbre : abd
+            L'arbre à transformer en graphe.
+        rangs : bool, optional
+            Ajoute à la fin un sous-graphe {rank=same} par étiquette, pour aligner les noeuds
+            d'une même variable. False par défaut.
 
-            Parameters
-            ----------
-            edges : method
-                Contient les liens à ajouter.
-            dot : graphviz.dot.Graph
-                le graphe.
+        Yields
+        ------
+        string
+            Les lignes dot d'un noeud (sa déclaration et ses liens vers ses fils),
+            puis celles des sous-graphes {rank=same}.
 
-            Returns
-            -------
-            dot : graphviz.dot.Graph
-                Le graphe contenant ses nouveaux liens.
+        """
 
-            """
-            
-            for edge in edges:
-                if len (edge) == 3:
-                    etiquette, faux, _ = edge
-                    dot.edge(etiquette, faux, style="dotted")
+        if arbre == None:
+            return
+        groupes = dict()
+        if isinstance (arbre, vue_abd):
+            g = arbre.gestionnaire
+            niveaux = g.niveaux
+            faux = g.faux
+            vrai = g.vrai
+            vus = bytearray (len (niveaux))
+            vus [arbre.indice] = 1
+            pile = [arbre.indice]
+            while pile:
+                noeud = pile.pop ()
+                if noeud < 2:
+                    etiquette = "True" if noeud == VRAI else "False"
+                    lignes = '\tn%d [label="%s"]\n' % (noeud, etiquette)
                 else:
-                    etiquette, vrai = edge
-                    dot.edge(etiquette, vrai)
-            return dot
-        
-        def aux (noeud, dot, edges, noeuds, nom):
-            """
-            Fonction récursive (auxiliaire de affiche())
+                    etiquette = "x%d" % g.variable (niveaux [noeud])
+                    fils_faux = faux [noeud]
+                    fils_vrai = vrai [noeud]
+                    lignes = '\tn%d [label="%s"]\n\tn%d -- n%d [style=dotted]\n\tn%d -- n%d\n' % (
+                        noeud, etiquette, noeud, fils_faux, noeud, fils_vrai)
+                    if not vus [fils_faux]:
+                        vus [fils_faux] = 1
+                        pile.append (fils_faux)
+                    if not vus [fils_vrai]:
+                        vus [fils_vrai] = 1
+                        pile.append (fils_vrai)
+                if rangs:
+                    groupes.setdefault (etiquette, []).append ("n%d" % noeud)
+                yield lignes
+        else:
+            ids = {arbre: "n0"}
+            pile = [arbre]
+            while pile:
+                noeud = pile.pop ()
+                nom = ids [noeud]
+                lignes = ['\t%s [label="%s"]\n' % (nom, noeud.etiquette)]
+                for fils, style in ((noeud.faux, " [style=dotted]"), (noeud.vrai, "")):
+                    if fils is None:
+                        continue
+                    nom_fils = ids.get (fils)
+                    if nom_fils is None:
+                        nom_fils = "n%d" % len (ids)
+                        ids [fils] = nom_fils
+                        pile.append (fils)
+                    lignes.append ("\t%s -- %s%s\n" % (nom, nom_fils, style))
+                if rangs:
+                    groupes.setdefault (noeud.etiquette, []).append (nom)
+                yield "".join (lignes)
+        for noms in groupes.values ():
+            yield "\t{rank=same; %s}\n" % "; ".join (noms)
 
-            Parameters
-            ----------
-            noeud : abd
-                DESCRIPTION.
-            dot : graphviz.dot.Graph
-                Le graphe.
-            edges : method
-                Contient les liens entre les noeuds dans le graphe.
-            noeuds : list
-                La liste des noeuds présent dans l'arbre.
-            nom : string
-                Le code du noeud.
+    @staticmethod
+    def ecrire_dot (arbre, flux, rangs=False):
+        """
+        Ecrit le graphe de l'arbre en langage dot dans un fichier ouvert, au fil du parcours
+        (sans construire de graphviz.Graph en mémoire)
 
-            Returns
-            -------
-            dot : graphviz.dot.Graph
-                Le graphique correspondant à l'arbre.
+        Parameters
+        ----------
+        arbre : abd
+            L'arbre à transformer en graphe.
+        flux : fichier texte
+            Le fichier ouvert en écriture.
+        rangs : bool, optional
+            Aligne les noeuds d'une même variable (cf. lignes_dot()). False par défaut.
 
-            """
-            
-            if noeud == None or (noeud.faux == None and noeud.vrai == None):
-                return dot
-            code_faux, faux = chercher_noeud (noeud.faux, noeuds)        
-            if faux:
-                edges.add ((nom, code_faux, "d"))
-            else:
-                code_faux = "f" + nom
-                dot.node(code_faux, noeud.faux.etiquette)
-                edges.add ((nom, code_faux, "d"))
-                noeuds.add ((code_faux, noeud.faux))
-                dot = aux (noeud.faux, dot, edges, noeuds, code_faux)
-            code_vrai, vrai = chercher_noeud (noeud.vrai, noeuds)
-            if vrai: 
-                edges.add ((nom, code_vrai))
-            else:
-                code_vrai = "v" + nom
-                dot.node(code_vrai, noeud.vrai.etiquette)
-                edges.add ((nom, code_vrai))
-                noeuds.add ((code_vrai, noeud.vrai))
-                dot = aux (noeud.vrai, dot, edges, noeuds, code_vrai)
-            
-            return dot
-        
-        edges = set()
-        noeuds = set()
-        dot.node("r", arbre.etiquette)
-        dot = aux (arbre, dot, edges, noeuds, "r")
-        ajouter_liens (edges, dot)
-        return dot
+        Returns
+        -------
+        None.
+
+        """
+
+        flux.write ("graph {\n")
+        flux.writelines (abd.lignes_dot (arbre, rangs))
+        flux.write ("}\n")
      
     @staticmethod
     def cons_arbre (table_verite):
@@ -168,33 +171,13 @@ class abd:
 
         """
         
-        def aux (table_verite, i):
-            """
-            Fonction récursive (auxiliaire de cons_arbre())
-
-            Parameters
-            ----------
-            table_verite : list of boolean
-                Une table de vérité.
-            i : int
-                Compteur de la hauteur dans l'arbre.
-
-            Returns
-            -------
-            abd
-                L'arbre binaire de décision.
-
-            """
-            
-            if i == 0:
-                return abd (str(table_verite[0]))
-            longueur = len (table_verite)
-            faux = table_verite [0:(longueur//2)]
-            vrai = table_verite [(longueur//2):]
-            noeud = abd ("x" + str(int(i)), aux (faux, i-1), aux (vrai, i-1))
-            return noeud
-        i = math.log2(len(table_verite))
-        return aux (table_verite, i)
+        niveau = [abd (str (valeur)) for valeur in table_verite]
+        i = 0
+        while len (niveau) > 1:
+            i += 1
+            etiquette = "x" + str (i)
+            niveau = [abd (etiquette, faux, vrai) for faux, vrai in zip (niveau [0::2], niveau [1::2])]
+        return niveau [0]
     
     @staticmethod
     def luka (arbre):
@@ -213,12 +196,26 @@ class abd:
 
         """
         
-        if arbre.faux == None and arbre.vrai == None:
-            return arbre
-        faux = abd.luka (arbre.faux)
-        vrai = abd.luka (arbre.vrai)
-        etiquette = "(" + arbre.etiquette + "(" + faux.etiquette + ")" + "(" + vrai.etiquette + "))"
-        return abd (etiquette, faux, vrai)
+        # Parcours préfixe (racine, vrai, faux) avec une pile explicite : à l'envers, il donne
+        # l'ordre postfixe (faux, vrai, racine) dans lequel les noeuds sont reconstruits.
+        ordre = []
+        pile = [arbre]
+        while pile:
+            noeud = pile.pop ()
+            ordre.append (noeud)
+            if noeud.faux is not None or noeud.vrai is not None:
+                pile.append (noeud.faux)
+                pile.append (noeud.vrai)
+        resultats = []
+        for noeud in reversed (ordre):
+            if noeud.faux is None and noeud.vrai is None:
+                resultats.append (noeud)
+            else:
+                vrai = resultats.pop ()
+                faux = resultats.pop ()
+                etiquette = "(" + noeud.etiquette + "(" + faux.etiquette + ")" + "(" + vrai.etiquette + "))"
+                resultats.append (abd (etiquette, faux, vrai))
+        return resultats [0]
     
     @staticmethod
     def compression (arbre):
@@ -238,29 +235,6 @@ class abd:
         """
         
         
-        def trouver (etiquette, noeuds):
-            """
-            Cherche une étiquette dans une liste de noeuds 
-
-            Parameters
-            ----------
-            etiquette : string
-                La variable qu'on cherche.
-            noeuds : list of abd
-                La liste de noeuds de l'arbre.
-
-            Returns
-            -------
-            abd
-                Le noeud qui contient l'étiquette recherchée, False sinon.
-
-            """
-            
-            for noeud in noeuds:
-                if noeud.etiquette == etiquette:
-                    return noeud
-            return False
-        
         def extraire_etiquette (etiquette_luka):
             """
             Extrait le nom de la variable d'un noeud à partir de son mot de Lukasiewicz
@@ -283,38 +257,19 @@ class abd:
                     i += 1
                 return etiquette_luka [1:i]
             return etiquette_luka
-        
-        def renommer (arbre):
-            """
-            Renomme chaque noeud de l'arbre par leur variable (modifie l'arbre reçu en paramètre)
-
-            Parameters
-            ----------
-            arbre : abd
-                L'arbre à renommer.
-
-            Returns
-            -------
-            None.
-
-            """
-            
-            if arbre == None:
-                return 
-            arbre.etiquette = extraire_etiquette (arbre.etiquette)
-            renommer (arbre.faux)
-            renommer (arbre.vrai)
                            
-        def aux (arbre, noeuds):
+        def aux (arbre, table_unique):
             """
-            Fonction récursive (auxiliaire de compression())
+            Parcours postfixe avec une pile explicite (auxiliaire de compression()) :
+            l'ordre préfixe (racine, vrai, faux) est construit puis parcouru à l'envers
 
             Parameters
             ----------
             arbre : abd
                 L'arbre à compresser.
-            noeuds : list of abd
-                La liste des noeuds de l'arbre.
+            table_unique : dict
+                La table unique : associe à une feuille son étiquette et à un noeud
+                le triplet (variable, id du fils faux, id du fils vrai).
 
             Returns
             -------
@@ -323,30 +278,40 @@ class abd:
 
             """
             
-            if arbre == None:
-                return None
-            if arbre.faux == None and arbre.vrai == None:
-                feuille = trouver (arbre.etiquette, noeuds)
-                if not feuille:
-                    nouv_feuille = abd (arbre.etiquette)
-                    noeuds.append (nouv_feuille)
-                    return nouv_feuille 
-                return feuille
-            noeud = trouver (arbre.etiquette, noeuds)
-            if not noeud:
-                faux = aux (arbre.faux, noeuds)
-                vrai = aux (arbre.vrai, noeuds)
-                nouv_arbre = abd (arbre.etiquette, faux, vrai)
-                noeuds.append (nouv_arbre)
-                return nouv_arbre
-            return noeud
+            ordre = []
+            pile = [arbre]
+            while pile:
+                noeud = pile.pop ()
+                ordre.append (noeud)
+                if noeud.faux is not None or noeud.vrai is not None:
+                    pile.append (noeud.faux)
+                    pile.append (noeud.vrai)
+            resultats = []
+            for noeud in reversed (ordre):
+                if noeud.faux is None and noeud.vrai is None:
+                    feuille = table_unique.get (noeud.etiquette)
+                    if feuille is None:
+                        feuille = abd (noeud.etiquette)
+                        table_unique [noeud.etiquette] = feuille
+                    resultats.append (feuille)
+                else:
+                    vrai = resultats.pop ()
+                    faux = resultats.pop ()
+                    etiquette = extraire_etiquette (noeud.etiquette)
+                    cle = (etiquette, id (faux), id (vrai))
+                    nouv_noeud = table_unique.get (cle)
+                    if nouv_noeud is None:
+                        nouv_noeud = abd (etiquette, faux, vrai)
+                        table_unique [cle] = nouv_noeud
+                    resultats.append (nouv_noeud)
+            return resultats [0]
         
-        res = aux (arbre, [])
-        renommer (res)
-        return res
+        if arbre == None:
+            return None
+        return aux (arbre, dict())
    
     @staticmethod
-    def dot (arbre, fichier):
+    def dot (arbre, fichier, rangs=False, compresse=None):
         """
         Construit un fichier représentant le graphe de l'arbre en langage dot
 
@@ -356,6 +321,10 @@ class abd:
             L'arbre à transformer en graphe.
         fichier : string
             Nom du fichier.
+        rangs : bool, optional
+            Aligne les noeuds d'une même variable (cf. lignes_dot()). False par défaut.
+        compresse : bool, optional
+            Ecrit le fichier compressé avec gzip. None par défaut (compressé si le nom finit par ".gz").
 
         Returns
         -------
@@ -363,50 +332,81 @@ class abd:
 
         """
         
-        f = open (fichier, "a")
-        f.write (str(abd.affiche (arbre)))
-        f.close()
+        if compresse is None:
+            compresse = fichier.endswith (".gz")
+        if compresse:
+            # Import local : gzip n'est nécessaire que pour les fichiers compressés
+            import gzip
+            f = gzip.open (fichier, "at", compresslevel=6)
+        else:
+            f = open (fichier, "a")
+        with f:
+            abd.ecrire_dot (arbre, f, rangs)
     
     @staticmethod
-    def compression_bdd (arbre):
+    def sauvegarder (arbre, fichier):
         """
-        Construit le ROBDD obtenu par compression de l'arbre
+        Sauvegarde un ROBDD dans un fichier binaire, relisible avec charger() (cf. gestionnaire.sauvegarder())
 
         Parameters
         ----------
         arbre : abd
-            L'arbre binaire de décision à compresser.
+            Le ROBDD à sauvegarder.
+        fichier : string
+            Nom du fichier.
 
         Returns
         -------
-        abd
-            Le ROBDD.
+        None.
 
         """
-        
-        
-        def trouver (etiquette, noeuds):
-            """
-            Cherche une étiquette dans une liste de noeuds 
 
-            Parameters
-            ----------
-            etiquette : string
-                La variable qu'on cherche.
-            noeuds : list of abd
-                La liste de noeuds de l'arbre.
+        if not isinstance (arbre, vue_abd):
+            arbre = abd.compression_bdd (arbre)
+        arbre.gestionnaire.sauvegarder (arbre.indice, fichier)
 
-            Returns
-            -------
-            abd
-                Le noeud qui contient l'étiquette recherchée, False sinon.
+    @staticmethod
+    def charger (fichier):
+        """
+        Ouvre un ROBDD sauvegardé avec sauvegarder(), projeté en mémoire sans être désérialisé
+        (cf. gestionnaire.charger())
 
-            """
-            
-            for noeud in noeuds:
-                if noeud.etiquette == etiquette:
-                    return noeud
-            return False
+        Parameters
+        ----------
+        fichier : string
+            Nom du fichier.
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD, dans un gestionnaire en lecture seule.
+
+        """
+
+        g, racine = gestionnaire.charger (fichier)
+        return vue_abd (g, racine)
+
+    @staticmethod
+    def compression_bdd (arbre, gest=None):
+        """
+        Construit le ROBDD obtenu par compression de l'arbre
+
+        Parameters
+        ----------
+        arbre : abd
+            L'arbre binaire de décision à compresser (ou son mot de Lukasiewicz, cf. luka()) :
+            les feuilles sont étiquetées "True" ou "False" et les noeuds internes x<i>, i >= 1
+            (ValueError sinon).
+        gest : gestionnaire, optional
+            Le gestionnaire dans lequel ranger le ROBDD. None par défaut (un nouveau gestionnaire).
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD.
+
+        """
+        
         
         def extraire_etiquette (etiquette_luka):
             """
@@ -423,106 +423,348 @@ class abd:
                 Le nom de la variable.
 
             """
-            if etiquette_luka [0] == '(':
+            if etiquette_luka [:1] == '(':
                 i = 1
-                while etiquette_luka [i] != '(':
+                while i < len (etiquette_luka) and etiquette_luka [i] != '(':
                     i += 1
                 return etiquette_luka [1:i]
             return etiquette_luka
-        
-        def renommer (arbre):
+
+        def numero_variable (etiquette):
             """
-            Renomme chaque noeud de l'arbre par leur variable (modifie l'arbre reçu en paramètre)
+            Retourne le numéro de la variable d'un noeud interne
 
             Parameters
             ----------
-            arbre : abd
-                L'arbre à renommer.
+            etiquette : string
+                L'étiquette du noeud (x<i> ou son mot de Lukasiewicz).
 
             Returns
             -------
-            None.
+            int
+                Le numéro i de la variable.
 
             """
-            if arbre == None:
-                return 
-            arbre.etiquette = extraire_etiquette (arbre.etiquette)
-            renommer (arbre.faux)
-            renommer (arbre.vrai)
-            
-        def est_inutile (fils):
+            nom = extraire_etiquette (etiquette)
+            if nom [:1] != "x" or not nom [1:].isdigit () or int (nom [1:]) < 1:
+                raise ValueError ("Etiquette de variable invalide (x<i> attendu) : " + repr (etiquette))
+            return int (nom [1:])
+                           
+        def aux (arbre, g):
             """
-            Retourne le fils unique du noeud s'il existe, False sinon
+            Parcours postfixe avec une pile explicite (auxiliaire de compression_bdd())
 
             Parameters
             ----------
-            fils : abd
-                Un noeud de l'arbre.
+            arbre : abd
+                L'arbre binaire de décision à compresser.
+            g : gestionnaire
+                Le gestionnaire dans lequel le ROBDD est construit (sa table unique
+                associe chaque triplet (variable, fils faux, fils vrai) à un seul noeud).
 
             Returns
             -------
-            abd
-                Le fils du noeud s'il est unique, False sinon.
+            int
+                L'indice du ROBDD dans g.
 
             """
             
-            if fils.faux == None and fils.vrai == None:
-                return False
-            if fils.faux == fils.vrai:
-                return fils.faux
-            return False
-                           
-        def aux (arbre, noeuds, racine=False):
-            """
-            Fonction récursive (auxiliaire de compression_bdd())
+            deja_vus = dict()
+            pile = [arbre]
+            while pile:
+                noeud = pile [-1]
+                if noeud in deja_vus:
+                    pile.pop ()
+                    continue
+                fils_faux = noeud.faux
+                fils_vrai = noeud.vrai
+                if fils_faux is None and fils_vrai is None:
+                    if noeud.etiquette not in ("True", "False"):
+                        raise ValueError ("Etiquette de feuille invalide (True ou False attendu) : "
+                                          + repr (noeud.etiquette))
+                    deja_vus [noeud] = VRAI if noeud.etiquette == "True" else FAUX
+                    pile.pop ()
+                    continue
+                faux = deja_vus.get (fils_faux)
+                vrai = deja_vus.get (fils_vrai)
+                if faux is None or vrai is None:
+                    if faux is None:
+                        pile.append (fils_faux)
+                    if vrai is None:
+                        pile.append (fils_vrai)
+                    continue
+                variable = numero_variable (noeud.etiquette)
+                deja_vus [noeud] = g.construire (variable, faux, vrai)
+                pile.pop ()
+            return deja_vus [arbre]
+        
+        if arbre == None:
+            return None
+        if gest is None:
+            g = gestionnaire ()
+        else:
+            g = gest
+        if isinstance (arbre, vue_abd):
+            res = g.importer (arbre.gestionnaire, arbre.indice)
+        else:
+            res = aux (arbre, g)
+        if gest is None:
+            g.compacter ()
+            return vue_abd (g, res)
+        vue = vue_abd (g, res)
+        g.verifier_taille ()
+        return vue
+
+    @staticmethod
+    def cons_robdd (table_verite, nb_feuilles=None, gest=None):
+        """
+        Construit directement le ROBDD associé à une table de vérité, niveau par niveau
+        (même résultat que compression_bdd (luka (cons_arbre (table_verite))) sans construire l'arbre)
+
+        Parameters
+        ----------
+        table_verite : list of boolean or int
+            Une table de vérité, ou l'entier x dont elle est issue (cf. table()).
+        nb_feuilles : int, optional
+            La taille de la table de vérité, obligatoire si table_verite est un entier. None par défaut.
+        gest : gestionnaire, optional
+            Le gestionnaire dans lequel ranger le ROBDD : les noeuds déjà présents (sous-fonctions
+            communes avec d'autres ROBDD) sont réutilisés et, si table_verite est un entier, le ROBDD
+            de chaque sous-table de 8 et 16 bits (variables x_1 à x_3 et x_1 à x_4) est mémorisé
+            dans sa table de calcul.
+            None par défaut (un nouveau gestionnaire).
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD.
+
+        """
+
+        g = gestionnaire () if gest is None else gest
+        construire = g.noeud if g.ordre_naturel () else g.construire
+        def reduire (niveau, i):
+            while len (niveau) > 1:
+                i += 1
+                niveau = [construire (i, niveau [j], niveau [j + 1]) for j in range (0, len (niveau), 2)]
+            return niveau
+
+        def sous_table (bits, largeur):
+            cle = ("table", largeur, bits)
+            noeud = g.cache.get (cle)
+            if noeud is None:
+                if largeur == 8:
+                    noeud = reduire ([(bits >> k) & 1 for k in range (8)], 0) [0]
+                else:
+                    noeud = construire (4, sous_table (bits & 0xFF, 8), sous_table (bits >> 8, 8))
+                g.cache [cle] = noeud
+            return noeud
+
+        if gest is not None and nb_feuilles is not None and nb_feuilles >= 16:
+            x = table_verite & ((1 << nb_feuilles) - 1)
+            niveau = [sous_table ((x >> debut) & 0xFFFF, 16) for debut in range (0, nb_feuilles, 16)]
+            niveau = reduire (niveau, 4)
+        else:
+            if nb_feuilles is None:
+                valeurs = table_verite
+            else:
+                bits = format (table_verite & ((1 << nb_feuilles) - 1), "b").zfill (nb_feuilles)
+                valeurs = (bit == "1" for bit in reversed (bits))
+            niveau = reduire ([VRAI if valeur else FAUX for valeur in valeurs], 0)
+        if gest is None:
+            g.compacter ()
+            return vue_abd (g, niveau [0])
+        vue = vue_abd (g, niveau [0])
+        g.verifier_taille ()
+        return vue
+
+    @staticmethod
+    def appliquer (arbre1, arbre2, op):
+        """
+        Combine deux ROBDD par un opérateur binaire en une seule passe (algorithme Apply),
+        sans construire le graphe produit de fusion_ROBDD()
+
+        Parameters
+        ----------
+        arbre1 : abd
+            1er ROBDD.
+        arbre2 : abd
+            2ème ROBDD.
+        op : string or fonction
+            L'opérateur : "et", "ou", "xor", "nand", "implique", "equiv",
+            ou un opérateur sur les tables de vérité en string (comme et()).
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD résultat.
+
+        """
+
+        # Les vues protègent les opérandes d'un ramasse-miettes déclenché par la copie de arbre2
+        vue1 = abd.modifiable (arbre1)
+        g = vue1.gestionnaire
+        vue2 = abd.compression_bdd (arbre2, g)
+        res = vue_abd (g, g.appliquer (op, vue1.indice, vue2.indice))
+        g.verifier_taille ()
+        return res
+
+    @staticmethod
+    def modifiable (arbre):
+        """
+        Retourne le ROBDD sous forme de vue_abd dans un gestionnaire où l'on peut créer des noeuds :
+        le sien si possible, un nouveau sinon (arbre non compressé, gestionnaire en lecture seule)
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD dans un gestionnaire modifiable.
+
+        """
+
+        if isinstance (arbre, vue_abd) and not arbre.gestionnaire.lecture_seule:
+            return arbre
+        return abd.compression_bdd (arbre)
+
+    @staticmethod
+    def restreindre (arbre, variable, valeur):
+        """
+        Retourne le cofacteur d'un ROBDD pour x_variable = valeur, calculé sur le graphe réduit
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+        variable : int
+            Le numéro i de la variable x_i à fixer.
+        valeur : bool
+            La valeur de x_i.
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD résultat.
+
+        """
+
+        arbre = abd.modifiable (arbre)
+        g = arbre.gestionnaire
+        res = vue_abd (g, g.restreindre (arbre.indice, variable, valeur))
+        g.verifier_taille ()
+        return res
+
+    @staticmethod
+    def existe (arbre, variables):
+        """
+        Quantification existentielle : élimine les variables par la disjonction de leurs cofacteurs
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+        variables : int or list of int
+            Le numéro de la variable à éliminer, ou la liste de ces numéros.
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD résultat.
+
+        """
+
+        if isinstance (variables, int):
+            variables = [variables]
+        arbre = abd.modifiable (arbre)
+        g = arbre.gestionnaire
+        res = vue_abd (g, g.quantifier (arbre.indice, variables, "ou"))
+        g.verifier_taille ()
+        return res
+
+    @staticmethod
+    def pour_tout (arbre, variables):
+        """
+        Quantification universelle : élimine les variables par la conjonction de leurs cofacteurs
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+        variables : int or list of int
+            Le numéro de la variable à éliminer, ou la liste de ces numéros.
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD résultat.
+
+        """
+
+        if isinstance (variables, int):
+            variables = [variables]
+        arbre = abd.modifiable (arbre)
+        g = arbre.gestionnaire
+        res = vue_abd (g, g.quantifier (arbre.indice, variables, "et"))
+        g.verifier_taille ()
+        return res
+
+    @staticmethod
+    def composer (arbre, variable, arbre2):
+        """
+        Remplace la variable x_variable d'un ROBDD par un autre ROBDD (composition fonctionnelle)
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+        variable : int
+            Le numéro i de la variable x_i à remplacer.
+        arbre2 : abd
+            Le ROBDD qui remplace x_i.
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD résultat.
+
+        """
+
+        return abd.composer_vecteur (arbre, {variable: arbre2})
+
+    @staticmethod
+    def composer_vecteur (arbre, substitutions):
+        """
+        Remplace simultanément plusieurs variables d'un ROBDD par d'autres ROBDD
+        (cf. gestionnaire.composer())
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+        substitutions : dict
+            Associe au numéro de chaque variable à remplacer le ROBDD (abd) qui la remplace.
 
-            Parameters
-            ----------
-            arbre : abd
-                L'arbre binaire de décision à compresser.
-            noeuds : list of abd
-                La liste des noeuds de l'arbre.
-            racine : boolean, optional
-                Active le cas particulier de la racine. False par défaut.
+        Returns
+        -------
+        vue_abd
+            Le ROBDD résultat.
 
-            Returns
-            -------
-            abd
-                Le ROBDD.
+        """
 
-            """
-            
-            if arbre == None:
-                return None
-            if arbre.faux == None and arbre.vrai == None:
-                feuille = trouver (arbre.etiquette, noeuds)
-                if not feuille:
-                    nouv_feuille = abd (arbre.etiquette)
-                    noeuds.append (nouv_feuille)
-                    return nouv_feuille 
-                return feuille
-            noeud = trouver (arbre.etiquette, noeuds)
-            if not noeud:
-                faux = aux (arbre.faux, noeuds)
-                vrai = aux (arbre.vrai, noeuds)
-                nouv_faux = est_inutile (faux)
-                nouv_vrai = est_inutile (vrai)
-                if nouv_faux:
-                    faux = nouv_faux
-                if nouv_vrai:
-                    vrai = nouv_vrai                           
-                nouv_arbre = abd (arbre.etiquette, faux, vrai)
-                if racine and est_inutile(nouv_arbre):
-                    return faux 
-                noeuds.append (nouv_arbre)
-                return nouv_arbre
-            return noeud
-        
-        res = aux (arbre, [], True)
-        renommer (res)
+        arbre = abd.modifiable (arbre)
+        g = arbre.gestionnaire
+        # Les vues sont gardées jusqu'à la composition : elles protègent les substituts d'un
+        # ramasse-miettes déclenché par la copie des suivants (cf. gestionnaire.verifier_taille())
+        vues = {variable: abd.compression_bdd (arbre2, g) for variable, arbre2 in substitutions.items ()}
+        res = vue_abd (g, g.composer (arbre.indice, {variable: vue.indice for variable, vue in vues.items ()}))
+        g.verifier_taille ()
         return res
-     
-    @staticmethod   
+
+    @staticmethod
     def nb_noeuds (arbre):
         """
         Retourne le nombre de noeuds dans un arbre
@@ -539,16 +781,14 @@ class abd:
 
         """
         
-        def aux (arbre, noeuds):
+        def aux (arbre):
             """
-            Fonction récursive (auxiliaire de nb_noeuds())
+            Parcours en profondeur avec une pile explicite (auxiliaire de nb_noeuds())
 
             Parameters
             ----------
             arbre : abd
                 L'arbre.
-            noeuds : list of abd
-                La liste des noeuds de l'arbre déjà rencontrés.
 
             Returns
             -------
@@ -559,18 +799,272 @@ class abd:
             
             if arbre == None:
                 return 0
-            res = 1
-            noeuds.add(arbre)
-            if not arbre.faux in noeuds:
-                res += aux (arbre.faux, noeuds)
-            if not arbre.vrai in noeuds:
-                res += aux (arbre.vrai, noeuds)
-            return res
-        return aux (arbre, set())
+            noeuds = {arbre}
+            pile = [arbre]
+            while pile:
+                noeud = pile.pop ()
+                for fils in (noeud.faux, noeud.vrai):
+                    if fils != None and fils not in noeuds:
+                        noeuds.add (fils)
+                        pile.append (fils)
+            return len (noeuds)
+        if isinstance (arbre, vue_abd):
+            return arbre.gestionnaire.nb_noeuds (arbre.indice)
+        return aux (arbre)
+    
+    
+    @staticmethod
+    def nb_solutions (arbre, nb_variables):
+        """
+        Retourne le nombre d'affectations de x_1, ..., x_nb_variables qui satisfont un ROBDD
+        (cf. gestionnaire.nb_solutions())
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+        nb_variables : int
+            Le nombre de variables de la fonction.
+
+        Returns
+        -------
+        int
+            Le nombre de solutions.
+
+        """
+
+        if not isinstance (arbre, vue_abd):
+            arbre = abd.compression_bdd (arbre)
+        return arbre.gestionnaire.nb_solutions (arbre.indice, nb_variables)
+
+    @staticmethod
+    def solutions (arbre, nb_variables=None):
+        """
+        Enumère les solutions d'un ROBDD à la demande (cf. gestionnaire.solutions())
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+        nb_variables : int, optional
+            Si précisé, énumère les affectations complètes des nb_variables variables plutôt
+            que les cubes (une affectation partielle par chemin vers True). None par défaut.
+
+        Yields
+        ------
+        dict
+            Associe au numéro de chaque variable fixée sa valeur (bool).
+
+        """
+
+        if not isinstance (arbre, vue_abd):
+            arbre = abd.compression_bdd (arbre)
+        return arbre.gestionnaire.solutions (arbre.indice, nb_variables)
+    
+    @staticmethod
+    def tamiser (arbre, croissance_max=1.2):
+        """
+        Réordonne les variables du gestionnaire d'un ROBDD pour réduire sa taille (tamisage de Rudell,
+        cf. gestionnaire.tamiser()). Tous les ROBDD dont une vue_abd existe sont conservés.
+
+        Parameters
+        ----------
+        arbre : vue_abd
+            Le ROBDD.
+        croissance_max : float, optional
+            La croissance tolérée pendant le déplacement d'une variable. 1.2 par défaut.
+
+        Returns
+        -------
+        taille_avant : int
+            Le nombre de noeuds conservés avant le tamisage.
+        taille_apres : int
+            Ce nombre après le tamisage.
+
+        """
+
+        return arbre.gestionnaire.tamiser (croissance_max=croissance_max)
+
+    @staticmethod
+    def collecter (arbre):
+        """
+        Libère les noeuds du gestionnaire d'un ROBDD qui ne sont accessibles depuis aucune vue_abd
+        existante (cf. gestionnaire.collecter())
+
+        Parameters
+        ----------
+        arbre : vue_abd
+            Le ROBDD.
+
+        Returns
+        -------
+        int
+            Le nombre de noeuds libérés.
+
+        """
+
+        return arbre.gestionnaire.collecter ()
+
+    @staticmethod
+    def ordre_optimal (table_verite, nb_feuilles=None):
+        """
+        Cherche un ordre des variables qui minimise la taille du ROBDD d'une table de vérité
+        (programmation dynamique de Friedman et Supowit, utilisable jusqu'à une douzaine de variables).
+        Le nombre de noeuds de la variable x_v quand les variables d'un ensemble T sont en dessous
+        d'elle ne dépend pas de l'ordre de T ni de celui des variables au-dessus : c'est le nombre de
+        sous-fonctions distinctes sur T + {x_v} (une par affectation des autres variables) qui
+        dépendent de x_v. La meilleure taille de chaque ensemble S de variables du bas se déduit donc
+        de celles des ensembles S - {x_v}, en 3^n opérations environ au lieu de n! ordres.
+
+        Parameters
+        ----------
+        table_verite : list of boolean or int
+            Une table de vérité (cf. cons_arbre()), ou l'entier x dont elle est issue (cf. table()).
+        nb_feuilles : int, optional
+            La taille de la table de vérité, obligatoire si table_verite est un entier. None par défaut.
+
+        Returns
+        -------
+        ordre : list of int
+            Les numéros des variables du niveau 1 (au-dessus des feuilles) jusqu'à la racine
+            (comme gestionnaire.ordre [1:]) ; à taille égale, l'ordre naturel est préféré.
+        taille : int
+            Le nombre de noeuds (feuilles comprises, cf. nb_noeuds()) du ROBDD dans cet ordre.
+
+        """
+
+        if nb_feuilles is None:
+            valeurs = [1 if valeur else 0 for valeur in table_verite]
+        else:
+            valeurs = [(table_verite >> i) & 1 for i in range (nb_feuilles)]
+        nb_vars = len (valeurs).bit_length () - 1
+        if len (valeurs) != 1 << nb_vars:
+            raise ValueError ("La taille de la table de vérité doit être une puissance de 2")
+        # numeros [S] : pour chaque affectation des variables hors de S (la plus petite en poids faible),
+        # le numéro de la sous-fonction sur S obtenue ; seuls les ensembles de la taille courante sont gardés
+        numeros = {0: valeurs}
+        couts = {0: len (set (valeurs))}
+        choix = dict()
+        separateurs = dict()
+        for taille in range (1, nb_vars + 1):
+            suivants = dict()
+            for variables in itertools.combinations (range (nb_vars), taille):
+                S = sum (1 << v for v in variables)
+                meilleur = None
+                for v in reversed (variables):
+                    T = S & ~(1 << v)
+                    sous_fonctions = numeros [T]
+                    # Rang de x_v parmi les variables hors de T : il sépare les affectations x_v = 0 et x_v = 1
+                    rang = bin (~T & ((1 << v) - 1)).count ("1")
+                    cle = (len (sous_fonctions), rang)
+                    if cle not in separateurs:
+                        bas = [i for i in range (len (sous_fonctions)) if not (i >> rang) & 1]
+                        separateurs [cle] = (itemgetter (*bas), itemgetter (*[i | (1 << rang) for i in bas]))
+                    bas, haut = separateurs [cle]
+                    if len (sous_fonctions) == 2:
+                        paires = [(sous_fonctions [0], sous_fonctions [1])]
+                    else:
+                        paires = list (zip (bas (sous_fonctions), haut (sous_fonctions)))
+                    cout = couts [T] + len ({paire for paire in paires if paire [0] != paire [1]})
+                    if meilleur is None or cout < meilleur:
+                        meilleur = cout
+                        choix [S] = v
+                couts [S] = meilleur
+                distinctes = dict()
+                suivants [S] = [distinctes.setdefault (paire, len (distinctes)) for paire in paires]
+            numeros = suivants
+        S = (1 << nb_vars) - 1
+        ordre = []
+        while S:
+            ordre.append (choix [S] + 1)
+            S &= ~(1 << choix [S])
+        ordre.reverse ()
+        return ordre, couts [(1 << nb_vars) - 1]
+
+    @staticmethod
+    def evaluer_lot (arbre, affectations):
+        """
+        Evalue un ROBDD sur un lot d'affectations avec NumPy : toutes les lignes descendent ensemble
+        dans le diagramme, un niveau par tour, pour chaque niveau du support de la fonction
+        (cf. gestionnaire.niveaux_support()) en partant de celui de la racine.
+        Au tour d'un niveau de variable x_i, la table de transition envoie (noeud, valeur de x_i)
+        sur le fils du noeud s'il est à ce niveau et sur le noeud lui-même sinon ; elle est mise
+        à jour sur place d'un tour à l'autre (seules les entrées des noeuds du niveau changent).
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+        affectations : numpy.ndarray
+            Tableau (m, n) de bool ou d'entiers 0/1 : la colonne i - 1 donne la valeur de x_i.
+            Il faut au moins autant de colonnes que le plus grand numéro de variable dont dépend
+            la fonction (ValueError sinon).
+
+        Returns
+        -------
+        numpy.ndarray
+            Tableau (m,) de bool : la valeur de la fonction pour chaque ligne.
+
+        """
+
+        # Import local : NumPy n'est nécessaire que pour l'évaluation par lots
+        import numpy as np
+        if not isinstance (arbre, vue_abd):
+            arbre = abd.compression_bdd (arbre)
+        g = arbre.gestionnaire
+        support = g.niveaux_support (arbre.indice)
+        affectations = np.asarray (affectations)
+        nb_variables = max ((g.variable (niveau) for niveau in support), default=0)
+        if affectations.ndim != 2 or affectations.shape [1] < nb_variables:
+            raise ValueError ("Les affectations doivent former un tableau (m, n) avec n >= %d "
+                              "(le plus grand numéro de variable de la fonction)" % nb_variables)
+        niveaux = np.asarray (g.niveaux, dtype=np.intp)
+        # Les noeuds sont désignés par 2 * indice, pour que 2 * noeud + valeur indexe la table
+        transitions = np.arange (2 * len (niveaux), dtype=np.int32) & ~1
+        fils = np.empty (2 * len (niveaux), dtype=np.int32)
+        fils [0::2] = g.faux
+        fils [1::2] = g.vrai
+        fils *= 2
+        ordre = np.argsort (niveaux, kind="stable")
+        bornes = np.searchsorted (niveaux [ordre], np.arange (niveaux.max () + 2))
+        # Une ligne par variable, contiguë
+        colonnes = np.ascontiguousarray (affectations.T).astype (np.bool_, copy=False).view (np.uint8)
+        noeuds = np.full (colonnes.shape [1], 2 * arbre.indice, dtype=np.int32)
+        positions = np.empty_like (noeuds)
+        for niveau in reversed (support):
+            noeuds_niveau = ordre [bornes [niveau]:bornes [niveau + 1]]
+            transitions [2 * noeuds_niveau] = fils [2 * noeuds_niveau]
+            transitions [2 * noeuds_niveau + 1] = fils [2 * noeuds_niveau + 1]
+            np.add (noeuds, colonnes [g.variable (niveau) - 1], out=positions)
+            np.take (transitions, positions, out=noeuds)
+        return noeuds == 2 * VRAI
     
+    @staticmethod
+    def compiler (arbre, entier=False):
+        """
+        Compile un ROBDD en une fonction Python qui l'évalue (cf. gestionnaire.compiler())
+
+        Parameters
+        ----------
+        arbre : abd
+            Le ROBDD.
+        entier : bool, optional
+            Evalue par un test de bit dans la table de vérité codée en entier (peu de variables).
+            False par défaut (if imbriqués générés à partir du diagramme).
+
+        Returns
+        -------
+        fonction
+            Prend une séquence x (x [i - 1] la valeur de x_i) et retourne la valeur du ROBDD (bool).
+
+        """
+
+        if not isinstance (arbre, vue_abd):
+            arbre = abd.compression_bdd (arbre)
+        return arbre.gestionnaire.compiler (arbre.indice, entier)
     
     @staticmethod
-    def fusion_ROBDD (arbre1, arbre2):
+    def fusion_ROBDD (arbre1, arbre2, entiers=False):
         """
         Fusionne deux ROBDD
 
@@ -580,6 +1074,9 @@ class abd:
             1er ROBDD.
         arbre2 : abd
             2ème ROBDD.
+        entiers : bool, optional
+            Code les tables de vérité des noeuds par des entiers plutôt que par des string
+            (cf. renommer_entiers()). False par défaut.
 
         Returns
         -------
@@ -637,7 +1134,7 @@ class abd:
         
         def comparer_etiquettes (etiquette1, etiquette2):
             """
-            Compare la longueur de deux étiquettes
+            Compare deux étiquettes par le numéro de leur variable ("x10" après "x9")
 
             Parameters
             ----------
@@ -660,6 +1157,9 @@ class abd:
             e2 = etiquette2.split (diamant) [0]
             if e1 == e2:
                 return 0
+            if e1 [1:].isdigit () and e2 [1:].isdigit ():
+                e1 = int (e1 [1:])
+                e2 = int (e2 [1:])
             if e1 > e2:
                 return 1
             return -1
@@ -721,6 +1221,50 @@ class abd:
                 v1 = "0"
             return (v0, v1)
         
+        def tables_de_verite (arbre, feuille, combiner):
+            """
+            Calcule la valeur de chaque noeud de l'arbre à partir de celles de ses fils
+            (parcours postfixe avec une pile explicite, chaque noeud n'est traité qu'une fois)
+
+            Parameters
+            ----------
+            arbre : abd
+                ROBDD.
+            feuille : fonction
+                Calcule la valeur d'une feuille.
+            combiner : fonction
+                Calcule la valeur d'un noeud à partir des valeurs de ses fils faux et vrai.
+
+            Returns
+            -------
+            valeurs : dict
+                Associe à chaque noeud sa valeur.
+
+            """
+            
+            valeurs = dict()
+            pile = [arbre]
+            while pile:
+                noeud = pile [-1]
+                if noeud in valeurs:
+                    pile.pop ()
+                    continue
+                if noeud.faux == None and noeud.vrai == None:
+                    valeurs [noeud] = feuille (noeud)
+                    pile.pop ()
+                    continue
+                faux = valeurs.get (noeud.faux)
+                vrai = valeurs.get (noeud.vrai)
+                if faux is None or vrai is None:
+                    if faux is None:
+                        pile.append (noeud.faux)
+                    if vrai is None:
+                        pile.append (noeud.vrai)
+                    continue
+                valeurs [noeud] = combiner (faux, vrai)
+                pile.pop ()
+            return valeurs
+        
         def renommer_binaire (arbre):
             """
             Renomme les noeuds de l'arbre en binaire.
@@ -740,14 +1284,28 @@ class abd:
 
             """
             
-            arbreestFeuille = (arbre.faux == None and arbre.vrai == None)
-            if arbreestFeuille:
-                v0, v1 = table_feuille (arbre)
-                arbre.etiquette = v0 + "\n" + v1
-                return (v0, v1)
-            else:
-                v00, v01 = renommer_binaire (arbre.faux) 
-                v10, v11 = renommer_binaire (arbre.vrai)
+            def combiner (faux, vrai):
+                """
+                Construit les tables d'un noeud à partir de celles de ses fils
+
+                Parameters
+                ----------
+                faux : (string, string)
+                    Les tables du fils faux.
+                vrai : (string, string)
+                    Les tables du fils vrai.
+
+                Returns
+                -------
+                v0 : string
+                    le nombre binaire issu du sous-arbre faux.
+                v1 : string
+                    Le nombre binaire remonté du sous-arbre vrai.
+
+                """
+                
+                v00, v01 = faux
+                v10, v11 = vrai
                 taille_v00 = len (v00)
                 taille_v10 = len (v10)
                 if taille_v00 > taille_v10:
@@ -756,14 +1314,88 @@ class abd:
                 if taille_v00 < taille_v10:
                     v00 = equilibrer_etiquettes (v10, v00)
                     v01 = equilibrer_etiquettes (v11, v01)       
-                v0 = v00 + v10
-                v1 = v01 + v11
-                arbre.etiquette = v0 + "\n" + v1
-                return (v0, v1)
+                return (v00 + v10, v01 + v11)
+            
+            valeurs = tables_de_verite (arbre, table_feuille, combiner)
+            for noeud, (v0, v1) in valeurs.items ():
+                noeud.etiquette = v0 + "\n" + v1
+            return valeurs [arbre]
         
-        def aux (arbre1, arbre2, noeuds):
+        def renommer_entiers (arbre):
+            """
+            Renomme les noeuds de l'arbre par leurs tables de vérité codées en entiers :
+            le bit i d'une table correspond au caractère i de la table de renommer_binaire().
+            (Modifie l'arbre reçu en argument)
+
+            Parameters
+            ----------
+            arbre : abd
+                ROBDD.
+
+            Returns
+            -------
+            (int, int, int)
+                La nouvelle étiquette de la racine : les tables issues des deux ROBDD et leur taille.
+
+            """
+            
+            def feuille (arbre):
+                """
+                Construit les tables d'une feuille
+
+                Parameters
+                ----------
+                arbre : abd
+                    Une feuille.
+
+                Returns
+                -------
+                (int, int, int)
+                    Les tables de la feuille et leur taille (1).
+
+                """
+                
+                v0, v1 = table_feuille (arbre)
+                return (int (v0), int (v1), 1)
+            
+            def combiner (faux, vrai):
+                """
+                Construit les tables d'un noeud à partir de celles de ses fils
+
+                Parameters
+                ----------
+                faux : (int, int, int)
+                    Les tables du fils faux et leur taille.
+                vrai : (int, int, int)
+                    Les tables du fils vrai et leur taille.
+
+                Returns
+                -------
+                (int, int, int)
+                    Les tables du noeud et leur taille.
+
+                """
+                
+                v00, v01, taille0 = faux
+                v10, v11, taille1 = vrai
+                while taille0 < taille1:
+                    v00 |= v00 << taille0
+                    v01 |= v01 << taille0
+                    taille0 *= 2
+                while taille1 < taille0:
+                    v10 |= v10 << taille1
+                    v11 |= v11 << taille1
+                    taille1 *= 2
+                return (v00 | (v10 << taille0), v01 | (v11 << taille0), 2 * taille0)
+            
+            valeurs = tables_de_verite (arbre, feuille, combiner)
+            for noeud, valeur in valeurs.items ():
+                noeud.etiquette = valeur
+            return valeurs [arbre]
+        
+        def decomposer (arbre1, arbre2):
             """
-            Fonction récursive (auxiliaire de fusion_ROBDD())
+            Donne l'étiquette du noeud fusion de arbre1 et arbre2 et les couples à fusionner pour ses fils
 
             Parameters
             ----------
@@ -771,55 +1403,85 @@ class abd:
                 1er ROBDD.
             arbre2 : abd
                 2ème ROBDD.
-            noeuds : list of abd
-                La liste des noeuds déjà rencontrés.
 
             Returns
             -------
-            abd
-                L'arbre fusion de arbre1 et arbre2.
+            etiquette : string
+                L'étiquette du noeud fusion.
+            (abd, abd)
+                Le couple à fusionner pour le fils faux, None pour une feuille.
+            (abd, abd)
+                Le couple à fusionner pour le fils vrai, None pour une feuille.
 
             """
-             
+            
             arbre1estFeuille = arbre1.faux == None and arbre1.vrai == None
             arbre2estFeuille = arbre2.faux == None and arbre2.vrai == None
             
             comparaison = comparer_etiquettes (arbre1.etiquette, arbre2.etiquette)
             
             if  arbre1estFeuille and arbre2estFeuille :
-                etiquette = arbre1.etiquette + diamant + arbre2.etiquette
-                arbre = abd (etiquette)
-                
-            
-            elif arbre1estFeuille:
-                etiquette = arbre1.etiquette + diamant + arbre2.etiquette
-                arbre = abd(etiquette, aux(arbre1, arbre2.faux, noeuds), aux (arbre1, arbre2.vrai, noeuds))
-                
-            
-            elif arbre2estFeuille:
-                etiquette = arbre1.etiquette + diamant + arbre2.etiquette
-                arbre =  abd(etiquette, aux(arbre1.faux, arbre2, noeuds), aux(arbre1.vrai, arbre2, noeuds))
-            
-            elif comparaison == 0:
-                etiquette = arbre1.etiquette
-                arbre = abd (etiquette, aux (arbre1.faux, arbre2.faux, noeuds), aux (arbre1.vrai, arbre2.vrai, noeuds))
-            
-            elif comparaison == 1:
-                etiquette = arbre1.etiquette
-                arbre = abd (etiquette, aux (arbre1.faux, arbre2, noeuds), aux (arbre1.vrai, arbre2, noeuds))
-            else:
-                etiquette = arbre2.etiquette
-                arbre = abd (etiquette, aux (arbre1, arbre2.faux, noeuds), aux (arbre1, arbre2.vrai, noeuds))
+                return (arbre1.etiquette + diamant + arbre2.etiquette, None, None)
+            if arbre1estFeuille:
+                return (arbre1.etiquette + diamant + arbre2.etiquette, (arbre1, arbre2.faux), (arbre1, arbre2.vrai))
+            if arbre2estFeuille:
+                return (arbre1.etiquette + diamant + arbre2.etiquette, (arbre1.faux, arbre2), (arbre1.vrai, arbre2))
+            if comparaison == 0:
+                return (arbre1.etiquette, (arbre1.faux, arbre2.faux), (arbre1.vrai, arbre2.vrai))
+            if comparaison == 1:
+                return (arbre1.etiquette, (arbre1.faux, arbre2), (arbre1.vrai, arbre2))
+            return (arbre2.etiquette, (arbre1, arbre2.faux), (arbre1, arbre2.vrai))
+        
+        def aux (arbre1, arbre2, noeuds):
+            """
+            Construction du graphe produit avec une pile explicite (auxiliaire de fusion_ROBDD()) :
+            les fils d'un noeud sont construits (faux puis vrai) avant lui
+
+            Parameters
+            ----------
+            arbre1 : abd
+                1er ROBDD.
+            arbre2 : abd
+                2ème ROBDD.
+            noeuds : list of abd
+                La liste des noeuds déjà rencontrés.
+
+            Returns
+            -------
+            abd
+                L'arbre fusion de arbre1 et arbre2.
+
+            """
             
-            noeud = arbre_deja_present (arbre, noeuds)
-            if not noeud:
-                noeuds.add (arbre)
-                return arbre
-            return noeud
+            resultats = []
+            pile = [(arbre1, arbre2, False)]
+            while pile:
+                arbre1, arbre2, fils_faits = pile.pop ()
+                etiquette, faux, vrai = decomposer (arbre1, arbre2)
+                if faux is None:
+                    arbre = abd (etiquette)
+                elif not fils_faits:
+                    pile.append ((arbre1, arbre2, True))
+                    pile.append (vrai + (False,))
+                    pile.append (faux + (False,))
+                    continue
+                else:
+                    vrai = resultats.pop ()
+                    faux = resultats.pop ()
+                    arbre = abd (etiquette, faux, vrai)
+                noeud = arbre_deja_present (arbre, noeuds)
+                if not noeud:
+                    noeuds.add (arbre)
+                    noeud = arbre
+                resultats.append (noeud)
+            return resultats [0]
             
            
         res = aux (arbre1, arbre2, set())
-        renommer_binaire(res)
+        if entiers:
+            renommer_entiers (res)
+        else:
+            renommer_binaire(res)
         return res
     
     @staticmethod
@@ -832,7 +1494,9 @@ class abd:
         arbre : abd
             ROBDD.
         op : fonction
-            L'opérateur (prenant deux binaires sous forme de string).
+            L'opérateur (prenant deux binaires sous forme de string). Si les tables de
+            vérité de l'arbre sont codées en entiers (cf. fusion_ROBDD()), il est converti
+            par operateur_entier().
 
         Returns
         -------
@@ -842,20 +1506,19 @@ class abd:
         """
         
         diamant = u"\u25C7" 
+        entiers = isinstance (arbre.etiquette, tuple)
+        if entiers:
+            op_entier = operateur_entier (op)
         
-
-        
-        def renommer_variables (arbre, noeuds=set()):
+        def renommer_variables (arbre):
             """
-            Renomme les noeuds de l'arbre avec les variables.
+            Renomme les noeuds de l'arbre avec les variables (parcours avec une pile explicite).
             (Modifie l'arbre reçu en argument)
 
             Parameters
             ----------
             arbre : abd
                 ROBDD.
-            noeuds : list of abd, optional
-                La liste des noeuds déjà traités. set() par défaut.
 
             Returns
             -------
@@ -863,45 +1526,49 @@ class abd:
 
             """
             
-            if arbre == None or arbre in noeuds:
-                return
-            taille_etiquette = len (arbre.etiquette)
-            if taille_etiquette == 1:
-                if arbre.etiquette == "0":
-                    arbre.etiquette = "False"
-                else:
-                    arbre.etiquette = "True"
+            noeuds = set()
+            pile = [arbre]
+            while pile:
+                arbre = pile.pop ()
+                if arbre == None or arbre in noeuds:
+                    continue
                 noeuds.add (arbre)
-                return 
-            i = int (math.log2 (taille_etiquette))
-            arbre.etiquette = "x" + str (i)
-            noeuds.add (arbre)
-            renommer_variables (arbre.faux, noeuds)
-            renommer_variables (arbre.vrai, noeuds)
-            return
+                if entiers:
+                    valeur, taille_etiquette = arbre.etiquette
+                else:
+                    valeur, taille_etiquette = arbre.etiquette, len (arbre.etiquette)
+                if taille_etiquette == 1:
+                    if str (valeur) == "0":
+                        arbre.etiquette = "False"
+                    else:
+                        arbre.etiquette = "True"
+                    continue
+                i = int (math.log2 (taille_etiquette))
+                arbre.etiquette = "x" + str (i)
+                pile.append (arbre.vrai)
+                pile.append (arbre.faux)
             
-        def trouver (etiquette, noeuds):
+        def calculer_etiquette (arbre):
             """
-            Cherche une étiquette dans une liste de noeuds 
+            Applique l'opérateur aux deux tables de vérité d'un noeud
 
             Parameters
             ----------
-            etiquette : string
-                La variable qu'on cherche.
-            noeuds : list of abd
-                La liste de noeuds de l'arbre.
+            arbre : abd
+                Un noeud de l'arbre.
 
             Returns
             -------
-            abd
-                Le noeud qui contient l'étiquette recherchée, False sinon.
+            string or (int, int)
+                La table résultat (avec sa taille si elle est codée en entier).
 
             """
             
-            for noeud in noeuds:
-                if noeud.etiquette == etiquette:
-                    return noeud
-            return False
+            if entiers:
+                v0, v1, taille = arbre.etiquette
+                return (op_entier (v0, v1, (1 << taille) - 1), taille)
+            operandes = arbre.etiquette.split ("\n")
+            return op (operandes [0], operandes [1])
         
         def est_inutile (fils):
             """
@@ -925,18 +1592,17 @@ class abd:
                 return fils.faux
             return False
         
-        def aux (arbre, noeuds, racine=False):
+        def aux (arbre, noeuds):
             """
-            Fonction récursive (auxiliaire de simplification_et_reduction_ROBDD())
+            Parcours postfixe avec une pile explicite (auxiliaire de simplification_et_reduction_ROBDD()) :
+            un noeud dont l'étiquette est déjà traitée est réutilisé sans parcourir ses fils
 
             Parameters
             ----------
             arbre : abd
                 ROBDD.
-            noeuds : list of abd
-                La liste des noeuds déjà traités.
-            racine : bool, optional
-                Indique si on traite la racine. False par défaut.
+            noeuds : dict
+                Associe aux étiquettes déjà traitées leur noeud.
 
             Returns
             -------
@@ -945,38 +1611,95 @@ class abd:
 
             """
             
-            arbreestFeuille = arbre.faux == None and arbre.vrai == None
-            operandes = arbre.etiquette.split ("\n")
-            etiquette = op (operandes [0], operandes [1])
-            if arbreestFeuille:
-                noeud = trouver (etiquette, noeuds)
-                if not noeud:
-                    arbre = abd (etiquette)
-                    noeuds.add (arbre)
-                    return arbre
-                return noeud
-            
-            noeud = trouver (etiquette, noeuds)
-            if not noeud:
-                faux = aux (arbre.faux, noeuds)
-                vrai = aux (arbre.vrai, noeuds)
+            resultats = []
+            pile = [(arbre, None)]
+            while pile:
+                arbre, etiquette = pile.pop ()
+                if etiquette is None:
+                    etiquette = calculer_etiquette (arbre)
+                    noeud = noeuds.get (etiquette)
+                    if noeud is not None:
+                        resultats.append (noeud)
+                        continue
+                    if arbre.faux == None and arbre.vrai == None:
+                        noeud = abd (etiquette)
+                        noeuds [etiquette] = noeud
+                        resultats.append (noeud)
+                        continue
+                    pile.append ((arbre, etiquette))
+                    pile.append ((arbre.vrai, None))
+                    pile.append ((arbre.faux, None))
+                    continue
+                vrai = resultats.pop ()
+                faux = resultats.pop ()
                 nouv_faux = est_inutile (faux)
                 nouv_vrai = est_inutile (vrai)
                 if nouv_faux:
                     faux = nouv_faux
                 if nouv_vrai:
                     vrai = nouv_vrai
-                arbre = abd (etiquette, faux, vrai)
-                if racine and est_inutile(arbre):
-                    return faux 
-                noeuds.add (arbre)
-                return arbre
-            return noeud
+                noeud = abd (etiquette, faux, vrai)
+                if not pile and est_inutile (noeud):
+                    resultats.append (faux)
+                    continue
+                noeuds [etiquette] = noeud
+                resultats.append (noeud)
+            return resultats [0]
             
-        res = aux (arbre, set(), True)
+        res = aux (arbre, dict())
         renommer_variables (res)
         return res
         
+class vue_abd (abd):
+    def __init__ (self, gestionnaire, indice):
+        """
+        Vue d'un noeud rangé dans un gestionnaire, utilisable comme un abd
+        (étiquette et fils sont lus dans les tableaux du gestionnaire).
+        La vue est enregistrée comme racine du gestionnaire tant qu'elle existe : son noeud
+        est conservé par gestionnaire.tamiser().
+
+        Parameters
+        ----------
+        gestionnaire : gestionnaire
+            Le gestionnaire qui contient le noeud.
+        indice : int
+            L'indice du noeud dans le gestionnaire.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.gestionnaire = gestionnaire
+        self.indice = indice
+        gestionnaire.ajouter_racine (indice)
+
+    def __del__ (self):
+        self.gestionnaire.retirer_racine (self.indice)
+
+    @property
+    def etiquette (self):
+        return self.gestionnaire.etiquette (self.indice)
+
+    @property
+    def faux (self):
+        if self.indice < 2:
+            return None
+        return vue_abd (self.gestionnaire, self.gestionnaire.faux [self.indice])
+
+    @property
+    def vrai (self):
+        if self.indice < 2:
+            return None
+        return vue_abd (self.gestionnaire, self.gestionnaire.vrai [self.indice])
+
+    def __eq__ (self, autre):
+        return isinstance (autre, vue_abd) and self.indice == autre.indice and self.gestionnaire is autre.gestionnaire
+
+    def __hash__ (self):
+        return hash ((id (self.gestionnaire), self.indice))
+
 def et (table1, table2):
     """
     Opérateur booléen.
@@ -995,32 +1718,66 @@ def et (table1, table2):
 
     """
     
-    res = ""
-    for i in range (len(table1)):
-        if table1 [i] == "1" and table2 [i] == "1":
-            res += "1"
-        else:
-            res += "0"
-    return res
-        
-arbre = abd.cons_arbre(table(61152,16))  
-arbre2 = abd.luka(arbre)
-arbre3 = abd.compression_bdd(arbre2)  
-
-arbre4 = abd.cons_arbre(table(28662,16))  
-arbre5 = abd.luka(arbre4)
-arbre6 = abd.compression_bdd(arbre5)  
-
-fusion3_6 = abd.fusion_ROBDD (arbre3, arbre6)
-fusion3_6_bdd = abd.simplification_et_reduction_ROBDD(fusion3_6, et)
-        
-         
+    return "".join ("1" if a == "1" and b == "1" else "0" for a, b in zip (table1, table2))
+
+# Opérateurs sur les tables de vérité codées en entiers (masque : les bits de la table)
+OPERATEURS_ENTIERS = {
+    OPERATEURS ["et"]: lambda a, b, masque: a & b,
+    OPERATEURS ["ou"]: lambda a, b, masque: a | b,
+    OPERATEURS ["xor"]: lambda a, b, masque: a ^ b,
+    OPERATEURS ["nand"]: lambda a, b, masque: ~(a & b) & masque,
+    OPERATEURS ["implique"]: lambda a, b, masque: (~a | b) & masque,
+    OPERATEURS ["equiv"]: lambda a, b, masque: ~(a ^ b) & masque,
+}
+
+def operateur_entier (op):
+    """
+    Convertit un opérateur en opérateur sur les tables de vérité codées en entiers
 
-                
-"""arbre = abd.cons_arbre(table(38,8))  
-arbre2 = abd.luka(arbre)
-arbre3 = abd.compression(arbre2)
-arbre4 = abd.compression_bdd(arbre2)"""
+    Parameters
+    ----------
+    op : string, int ou fonction
+        Le nom de l'opérateur, son code, ou un opérateur sur les tables en string
+        (comme et()), cf. code_operateur().
 
+    Returns
+    -------
+    fonction
+        L'opérateur, prenant les deux tables et le masque de leurs bits.
 
-        
\ No newline at end of file
+    """
+    
+    code = code_operateur (op)
+    if code in OPERATEURS_ENTIERS:
+        return OPERATEURS_ENTIERS [code]
+    def op_entier (a, b, masque):
+        res = 0
+        if code & 1:
+            res |= ~a & ~b
+        if code & 2:
+            res |= ~a & b
+        if code & 4:
+            res |= a & ~b
+        if code & 8:
+            res |= a & b
+        return res & masque
+    return op_entier
+
+if __name__ == "__main__":
+    arbre = abd.cons_arbre(table(61152,16))  
+    arbre2 = abd.luka(arbre)
+    arbre3 = abd.compression_bdd(arbre2)  
+
+    arbre4 = abd.cons_arbre(table(28662,16))  
+    arbre5 = abd.luka(arbre4)
+    arbre6 = abd.compression_bdd(arbre5)  
+
+    fusion3_6 = abd.fusion_ROBDD (arbre3, arbre6)
+    fusion3_6_bdd = abd.simplification_et_reduction_ROBDD(fusion3_6, et)
+
+    et3_6 = abd.appliquer (arbre3, arbre6, "et")
+
+    """arbre = abd.cons_arbre(table(38,8))  
+    arbre2 = abd.luka(arbre)
+    arbre3 = abd.compression(arbre2)
+    arbre4 = abd.compression_bdd(arbre2)"""
@@ -0,0 +1,237 @@
+from abd import abd, et
+from echauffement import table
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Les étapes mesurées, dans l'ordre du pipeline (chacune part des résultats de la précédente,
+# calculés une fois pour toutes hors mesure)
+ETAPES = ["table", "cons_arbre", "luka", "compression_bdd", "nb_noeuds", "fusion_ROBDD", "affiche"]
+
+VERSION = 1
+
+
+def etapes_pipeline (nb_vars, graine=0):
+    """
+    Prépare les étapes du pipeline pour deux fonctions booléennes aléatoires (toujours les mêmes
+    pour une graine et un nombre de variables donnés)
+
+    Parameters
+    ----------
+    nb_vars : int
+        Le nombre de variables.
+    graine : int, optional
+        La graine du générateur aléatoire. 0 par défaut.
+
+    Returns
+    -------
+    dict
+        Associe à chaque étape (cf. ETAPES) une fonction sans argument qui l'exécute.
+
+    """
+
+    alea = random.Random (graine * 1000 + nb_vars)
+    nb_feuilles = 2 ** nb_vars
+    x = alea.getrandbits (nb_feuilles)
+    y = alea.getrandbits (nb_feuilles)
+    table1, table2 = table (x, nb_feuilles), table (y, nb_feuilles)
+    arbre1, arbre2 = abd.cons_arbre (table1), abd.cons_arbre (table2)
+    luka1, luka2 = abd.luka (arbre1), abd.luka (arbre2)
+    robdd1, robdd2 = abd.compression_bdd (luka1), abd.compression_bdd (luka2)
+    return {
+        "table": lambda: (table (x, nb_feuilles), table (y, nb_feuilles)),
+        "cons_arbre": lambda: (abd.cons_arbre (table1), abd.cons_arbre (table2)),
+        "luka": lambda: (abd.luka (arbre1), abd.luka (arbre2)),
+        "compression_bdd": lambda: (abd.compression_bdd (luka1), abd.compression_bdd (luka2)),
+        "nb_noeuds": lambda: (abd.nb_noeuds (robdd1), abd.nb_noeuds (robdd2)),
+        "fusion_ROBDD": lambda: abd.simplification_et_reduction_ROBDD (abd.fusion_ROBDD (robdd1, robdd2), et),
+        "affiche": lambda: (abd.affiche (robdd1), abd.affiche (robdd2)),
+    }
+
+def mesurer (fonction, nb_repetitions=20, nb_echauffements=1):
+    """
+    Mesure le temps et la mémoire d'une étape : les temps sont pris sans suivi de la mémoire,
+    le pic de mémoire lors d'une exécution supplémentaire suivie par tracemalloc.
+
+    Parameters
+    ----------
+    fonction : function
+        L'étape (sans argument).
+    nb_repetitions : int, optional
+        Le nombre d'exécutions mesurées. 20 par défaut (avec moins de 20 exécutions, le 95e
+        centile est le plus grand des temps).
+    nb_echauffements : int, optional
+        Le nombre d'exécutions préalables non mesurées. 1 par défaut.
+
+    Returns
+    -------
+    dict
+        La médiane et le 95e centile des temps (en secondes), le pic de mémoire allouée pendant
+        l'étape (en octets) et le nombre de répétitions.
+
+    """
+
+    for _ in range (nb_echauffements):
+        fonction ()
+    temps = []
+    for _ in range (nb_repetitions):
+        debut = time.perf_counter ()
+        fonction ()
+        temps.append (time.perf_counter () - debut)
+    temps.sort ()
+    tracemalloc.start ()
+    try:
+        avant = tracemalloc.get_traced_memory () [0]
+        tracemalloc.reset_peak ()
+        fonction ()
+        pic = tracemalloc.get_traced_memory () [1] - avant
+    finally:
+        tracemalloc.stop ()
+    return {
+        "mediane": statistics.median (temps),
+        "p95": temps [max (0, math.ceil (0.95 * len (temps)) - 1)],
+        "memoire_max": pic,
+        "repetitions": nb_repetitions,
+    }
+
+def lancer (nb_vars_min=2, nb_vars_max=16, nb_repetitions=20, nb_echauffements=1, graine=0, etapes=None, flux=None):
+    """
+    Exécute la suite de mesures pour chaque nombre de variables
+
+    Parameters
+    ----------
+    nb_vars_min : int, optional
+        Le plus petit nombre de variables. 2 par défaut.
+    nb_vars_max : int, optional
+        Le plus grand nombre de variables. 16 par défaut.
+    nb_repetitions : int, optional
+        Le nombre d'exécutions mesurées de chaque étape. 20 par défaut.
+    nb_echauffements : int, optional
+        Le nombre d'exécutions préalables non mesurées. 1 par défaut.
+    graine : int, optional
+        La graine des fonctions tirées. 0 par défaut.
+    etapes : list of string, optional
+        Les étapes à mesurer. None par défaut (toutes, cf. ETAPES).
+    flux : file, optional
+        Un flux où écrire l'avancement (une ligne par mesure). None par défaut.
+
+    Returns
+    -------
+    dict
+        Les paramètres de la suite et, pour chaque nombre de variables (en string) et chaque étape,
+        le résultat de mesurer().
+
+    """
+
+    if etapes is None:
+        etapes = ETAPES
+    resultats = dict()
+    for nb_vars in range (nb_vars_min, nb_vars_max + 1):
+        pipeline = etapes_pipeline (nb_vars, graine)
+        resultats [str (nb_vars)] = dict()
+        for etape in etapes:
+            mesure = mesurer (pipeline [etape], nb_repetitions, nb_echauffements)
+            resultats [str (nb_vars)] [etape] = mesure
+            if flux is not None:
+                flux.write ("%2d %-16s mediane %10.6f s  p95 %10.6f s  memoire %10d o\n"
+                            % (nb_vars, etape, mesure ["mediane"], mesure ["p95"], mesure ["memoire_max"]))
+                flux.flush ()
+    return {
+        "version": VERSION,
+        "python": platform.python_version (),
+        "parametres": {"nb_repetitions": nb_repetitions, "nb_echauffements": nb_echauffements, "graine": graine},
+        "resultats": resultats,
+    }
+
+def comparer (resultats, reference, tolerance=0.25, temps_min=5e-4, memoire_min=65536):
+    """
+    Compare une suite de mesures à une suite de référence et relève les régressions : une médiane
+    ou un pic de mémoire qui dépasse la référence de plus de tolerance (en proportion) et de plus
+    d'un seuil absolu (pour ignorer le bruit des étapes très courtes)
+
+    Parameters
+    ----------
+    resultats : dict
+        Les mesures (cf. lancer()).
+    reference : dict
+        Les mesures de référence.
+    tolerance : float, optional
+        La hausse relative tolérée. 0.25 par défaut.
+    temps_min : float, optional
+        La hausse de la médiane (en secondes) en dessous de laquelle rien n'est relevé. 5e-4 par défaut.
+    memoire_min : int, optional
+        La hausse du pic de mémoire (en octets) en dessous de laquelle rien n'est relevé. 65536 par défaut.
+
+    Returns
+    -------
+    list of tuple
+        Les régressions (nombre de variables, étape, mesure, valeur de référence, nouvelle valeur).
+
+    """
+
+    regressions = []
+    for nb_vars, etapes in resultats ["resultats"].items ():
+        for etape, mesure in etapes.items ():
+            ancienne = reference ["resultats"].get (nb_vars, dict()).get (etape)
+            if ancienne is None:
+                continue
+            for cle, seuil in (("mediane", temps_min), ("memoire_max", memoire_min)):
+                if mesure [cle] > ancienne [cle] * (1 + tolerance) and mesure [cle] - ancienne [cle] > seuil:
+                    regressions.append ((int (nb_vars), etape, cle, ancienne [cle], mesure [cle]))
+    return regressions
+
+def main (arguments=None):
+    """
+    Point d'entrée en ligne de commande : python benchmark.py [-h] [options]
+
+    Parameters
+    ----------
+    arguments : list of string, optional
+        Les arguments. None par défaut (ceux de la ligne de commande).
+
+    Returns
+    -------
+    int
+        Le code de retour : 1 si des régressions ont été relevées, 0 sinon.
+
+    """
+
+    parseur = argparse.ArgumentParser (description="Mesure les étapes de construction et de combinaison des ROBDD")
+    parseur.add_argument ("--min", type=int, default=2, help="plus petit nombre de variables (2)")
+    parseur.add_argument ("--max", type=int, default=16, help="plus grand nombre de variables (16)")
+    parseur.add_argument ("--repetitions", type=int, default=20, help="exécutions mesurées par étape (20)")
+    parseur.add_argument ("--echauffements", type=int, default=1, help="exécutions non mesurées par étape (1)")
+    parseur.add_argument ("--graine", type=int, default=0, help="graine des fonctions tirées (0)")
+    parseur.add_argument ("--etapes", nargs="+", choices=ETAPES, help="étapes à mesurer (toutes)")
+    parseur.add_argument ("--sortie", help="fichier JSON où écrire les mesures")
+    parseur.add_argument ("--comparer", metavar="REFERENCE", help="fichier JSON de référence à comparer")
+    parseur.add_argument ("--tolerance", type=float, default=0.25, help="hausse relative tolérée (0.25)")
+    args = parseur.parse_args (arguments)
+
+    resultats = lancer (args.min, args.max, args.repetitions, args.echauffements, args.graine, args.etapes, sys.stderr)
+    if args.sortie:
+        with open (args.sortie, "w") as f:
+            json.dump (resultats, f, indent=1)
+    else:
+        json.dump (resultats, sys.stdout, indent=1)
+        sys.stdout.write ("\n")
+    if args.comparer:
+        with open (args.comparer) as f:
+            reference = json.load (f)
+        regressions = comparer (resultats, reference, args.tolerance)
+        for nb_vars, etape, cle, ancienne, nouvelle in regressions:
+            sys.stderr.write ("REGRESSION %2d %-16s %-11s %.6g -> %.6g (x%.2f)\n"
+                              % (nb_vars, etape, cle, ancienne, nouvelle, nouvelle / ancienne if ancienne else math.inf))
+        if regressions:
+            return 1
+        sys.stderr.write ("Aucune régression par rapport à " + args.comparer + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit (main ())
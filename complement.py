@@ -0,0 +1,471 @@
+from array import array
+from abd import abd, vue_abd
+from gestionnaire import gestionnaire, code_operateur, FAUX, VRAI
+
+
+class gestionnaire_complement:
+    def __init__ (self):
+        """
+        Définition d'un gestionnaire de ROBDD à arcs complémentés.
+        Un ROBDD est désigné par une référence 2 * noeud + c : le bit c indique que la fonction
+        du noeud est complémentée, si bien que f et non f partagent les mêmes noeuds et que
+        la négation ne coûte rien (cf. non()). Une seule feuille (le noeud 0, la fonction False) :
+        la référence FAUX vaut 0 et la référence VRAI vaut 1. Pour que la représentation reste
+        canonique, le fils faux d'un noeud n'est jamais complémenté.
+        Les noeuds sont rangés dans trois tableaux parallèles (niveau, fils faux, fils vrai) comme
+        dans gestionnaire ; la variable x_i est au niveau i.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.niveaux = array ("i", [0])
+        self.faux = array ("i", [FAUX])
+        self.vrai = array ("i", [FAUX])
+        # Table unique : associe chaque triplet (niveau, fils faux, fils vrai) à son noeud
+        self.unique = dict()
+        # Table de calcul de ite(), indexée par ("ite", f, g, h) normalisé (cf. ite())
+        self.cache = dict()
+
+    def __len__ (self):
+        """
+        Retourne le nombre de noeuds du gestionnaire (feuille comprise)
+
+        Returns
+        -------
+        int
+            Le nombre de noeuds.
+
+        """
+
+        return len (self.niveaux)
+
+    def noeud (self, niveau, faux, vrai):
+        """
+        Retourne la référence du ROBDD (niveau, faux, vrai), en créant le noeud s'il n'existe pas
+        encore. Si le fils faux est complémenté, c'est le complément du noeud (niveau, non faux, non vrai)
+        qui est retourné.
+
+        Parameters
+        ----------
+        niveau : int
+            Le niveau du noeud, supérieur à ceux de ses fils.
+        faux : int
+            La référence du fils faux.
+        vrai : int
+            La référence du fils vrai.
+
+        Returns
+        -------
+        int
+            La référence du ROBDD, ou celle de son fils si les deux fils sont égaux.
+
+        """
+
+        if faux == vrai:
+            return faux
+        c = faux & 1
+        cle = (niveau, faux ^ c, vrai ^ c)
+        noeud = self.unique.get (cle)
+        if noeud is None:
+            noeud = len (self.niveaux)
+            self.niveaux.append (niveau)
+            self.faux.append (faux ^ c)
+            self.vrai.append (vrai ^ c)
+            self.unique [cle] = noeud
+        return 2 * noeud | c
+
+    def variable (self, variable):
+        """
+        Retourne la référence du ROBDD de la variable x_variable
+
+        Parameters
+        ----------
+        variable : int
+            Le numéro de la variable (au moins 1).
+
+        Returns
+        -------
+        int
+            La référence du ROBDD.
+
+        """
+
+        return self.noeud (variable, FAUX, VRAI)
+
+    def non (self, f):
+        """
+        Retourne la référence de la négation d'un ROBDD, sans créer de noeud
+
+        Parameters
+        ----------
+        f : int
+            La référence du ROBDD.
+
+        Returns
+        -------
+        int
+            La référence de non f.
+
+        """
+
+        return f ^ 1
+
+    def niveau (self, f):
+        """
+        Retourne le niveau de la racine d'un ROBDD (0 pour une constante)
+
+        Parameters
+        ----------
+        f : int
+            La référence du ROBDD.
+
+        Returns
+        -------
+        int
+            Le niveau.
+
+        """
+
+        return self.niveaux [f >> 1]
+
+    def cofacteurs (self, f):
+        """
+        Retourne les fils d'un ROBDD, complémentés si sa référence l'est
+
+        Parameters
+        ----------
+        f : int
+            La référence du ROBDD (pas une constante).
+
+        Returns
+        -------
+        (int, int)
+            Les références des fils faux et vrai.
+
+        """
+
+        c = f & 1
+        return self.faux [f >> 1] ^ c, self.vrai [f >> 1] ^ c
+
+    def ite (self, f, g, h):
+        """
+        Retourne le ROBDD de "si f alors g sinon h" (opérateur ITE), avec une pile explicite.
+        Chaque triplet est d'abord normalisé (f et g non complémentés, en utilisant
+        ite (non f, g, h) = ite (f, h, g) et ite (f, non g, non h) = non ite (f, g, h)), si bien que
+        les résultats mémorisés dans self.cache servent aussi pour les négations.
+
+        Parameters
+        ----------
+        f : int
+            La référence du ROBDD de la condition.
+        g : int
+            La référence du ROBDD du cas vrai.
+        h : int
+            La référence du ROBDD du cas faux.
+
+        Returns
+        -------
+        int
+            La référence du ROBDD résultat.
+
+        """
+
+        cache = self.cache
+        def normaliser (f, g, h):
+            """
+            Simplifie un triplet (auxiliaire de ite())
+
+            Parameters
+            ----------
+            f, g, h : int
+                Les références des arguments de ite().
+
+            Returns
+            -------
+            int or tuple
+                Le résultat s'il est immédiat, sinon le triplet normalisé et le bit de complément
+                à appliquer à son résultat.
+
+            """
+
+            if g == f:
+                g = VRAI
+            elif g == f ^ 1:
+                g = FAUX
+            if h == f:
+                h = FAUX
+            elif h == f ^ 1:
+                h = VRAI
+            if f == VRAI or g == h:
+                return g
+            if f == FAUX:
+                return h
+            if g == VRAI and h == FAUX:
+                return f
+            if g == FAUX and h == VRAI:
+                return f ^ 1
+            if f & 1:
+                f, g, h = f ^ 1, h, g
+            c = g & 1
+            return (f, g ^ c, h ^ c, c)
+
+        def immediat (f, g, h):
+            res = normaliser (f, g, h)
+            if isinstance (res, int):
+                return res
+            f, g, h, c = res
+            res = cache.get (("ite", f, g, h))
+            if res is None:
+                return None
+            return res ^ c
+
+        pile = [(f, g, h)]
+        while pile:
+            if immediat (*pile [-1]) is not None:
+                pile.pop ()
+                continue
+            a, b, c, _ = normaliser (*pile [-1])
+            niveau = max (self.niveau (a), self.niveau (b), self.niveau (c))
+            fils = []
+            for x in (a, b, c):
+                if self.niveau (x) == niveau:
+                    fils.append (self.cofacteurs (x))
+                else:
+                    fils.append ((x, x))
+            (a0, a1), (b0, b1), (c0, c1) = fils
+            r0 = immediat (a0, b0, c0)
+            r1 = immediat (a1, b1, c1)
+            if r0 is None or r1 is None:
+                if r0 is None:
+                    pile.append ((a0, b0, c0))
+                if r1 is None:
+                    pile.append ((a1, b1, c1))
+                continue
+            cache [("ite", a, b, c)] = self.noeud (niveau, r0, r1)
+            pile.pop ()
+        return immediat (f, g, h)
+
+    def appliquer (self, op, u, v):
+        """
+        Combine deux ROBDD par un opérateur binaire, ramené à un ITE :
+        op (u, v) = ite (u, op (1, v), op (0, v)), où op (a, v) est une constante, v ou non v.
+
+        Parameters
+        ----------
+        op : string, int ou fonction
+            L'opérateur (cf. gestionnaire.code_operateur()).
+        u : int
+            La référence du 1er ROBDD.
+        v : int
+            La référence du 2ème ROBDD.
+
+        Returns
+        -------
+        int
+            La référence du ROBDD résultat.
+
+        """
+
+        op = code_operateur (op)
+        def partiel (a):
+            b0 = (op >> (2 * a)) & 1
+            b1 = (op >> (2 * a + 1)) & 1
+            if b0 == b1:
+                return b0
+            return v if b1 else v ^ 1
+        return self.ite (u, partiel (1), partiel (0))
+
+    def cons_robdd (self, table_verite, nb_feuilles=None):
+        """
+        Construit le ROBDD à arcs complémentés d'une table de vérité, niveau par niveau
+        (cf. abd.cons_robdd())
+
+        Parameters
+        ----------
+        table_verite : list of boolean or int
+            Une table de vérité, ou l'entier x dont elle est issue (cf. table()).
+        nb_feuilles : int, optional
+            La taille de la table de vérité, obligatoire si table_verite est un entier. None par défaut.
+
+        Returns
+        -------
+        int
+            La référence du ROBDD.
+
+        """
+
+        if nb_feuilles is None:
+            valeurs = table_verite
+        else:
+            valeurs = ((table_verite >> i) & 1 for i in range (nb_feuilles))
+        niveau = [VRAI if valeur else FAUX for valeur in valeurs]
+        i = 0
+        while len (niveau) > 1:
+            i += 1
+            niveau = [self.noeud (i, niveau [j], niveau [j + 1]) for j in range (0, len (niveau), 2)]
+        return niveau [0]
+
+    def importer (self, autre, racine):
+        """
+        Copie un ROBDD d'un gestionnaire (sans arcs complémentés) dans ce gestionnaire
+
+        Parameters
+        ----------
+        autre : gestionnaire
+            Le gestionnaire qui contient le ROBDD.
+        racine : int
+            L'indice du ROBDD dans autre.
+
+        Returns
+        -------
+        int
+            La référence du ROBDD dans ce gestionnaire.
+
+        """
+
+        def direct (noeud):
+            if noeud == FAUX or noeud == VRAI:
+                return noeud
+            return None
+
+        def combiner (noeud, r0, r1):
+            x = self.variable (autre.variable (autre.niveaux [noeud]))
+            return self.ite (x, r1, r0)
+
+        return autre.transformer (racine, direct, combiner)
+
+    def importer_abd (self, arbre):
+        """
+        Copie un abd (arbre de décision ou ROBDD) dans ce gestionnaire
+
+        Parameters
+        ----------
+        arbre : abd
+            L'abd.
+
+        Returns
+        -------
+        int
+            La référence du ROBDD dans ce gestionnaire.
+
+        """
+
+        if not isinstance (arbre, vue_abd):
+            # compression_bdd() parcourt l'abd avec mémoire : un graphe partagé n'est pas déplié
+            arbre = abd.compression_bdd (arbre)
+        return self.importer (arbre.gestionnaire, arbre.indice)
+
+    def transformer (self, racine, feuille, combiner):
+        """
+        Parcours postfixe générique d'un ROBDD, avec une pile explicite : le résultat de chaque
+        référence (noeud et bit de complément) est calculé une seule fois.
+
+        Parameters
+        ----------
+        racine : int
+            La référence du ROBDD.
+        feuille : fonction
+            Prend la valeur d'une constante (bool) et retourne son résultat.
+        combiner : fonction
+            Prend le niveau d'un noeud et les résultats de ses fils faux et vrai (complémentés
+            si la référence l'est), et retourne son résultat.
+
+        Returns
+        -------
+        object
+            Le résultat de la racine.
+
+        """
+
+        resultats = {FAUX: feuille (False), VRAI: feuille (True)}
+        pile = [racine]
+        while pile:
+            f = pile [-1]
+            if f in resultats:
+                pile.pop ()
+                continue
+            f0, f1 = self.cofacteurs (f)
+            if f0 not in resultats or f1 not in resultats:
+                if f0 not in resultats:
+                    pile.append (f0)
+                if f1 not in resultats:
+                    pile.append (f1)
+                continue
+            resultats [f] = combiner (self.niveau (f), resultats [f0], resultats [f1])
+            pile.pop ()
+        return resultats [racine]
+
+    def nb_noeuds (self, racine):
+        """
+        Retourne le nombre de noeuds accessibles depuis une racine (feuille comprise) ;
+        un noeud atteint par un arc complémenté et par un arc normal n'est compté qu'une fois.
+
+        Parameters
+        ----------
+        racine : int
+            La référence du ROBDD.
+
+        Returns
+        -------
+        int
+            Le nombre de noeuds.
+
+        """
+
+        vus = {racine >> 1}
+        pile = [racine >> 1]
+        while pile:
+            noeud = pile.pop ()
+            if noeud == 0:
+                continue
+            for fils in (self.faux [noeud] >> 1, self.vrai [noeud] >> 1):
+                if fils not in vus:
+                    vus.add (fils)
+                    pile.append (fils)
+        return len (vus)
+
+    def en_abd (self, racine):
+        """
+        Convertit un ROBDD en abd (deux feuilles "True" et "False", sans arcs complémentés),
+        par exemple pour abd.affiche() : les sous-graphes communs restent partagés.
+
+        Parameters
+        ----------
+        racine : int
+            La référence du ROBDD.
+
+        Returns
+        -------
+        abd
+            Le ROBDD sous forme d'abd.
+
+        """
+
+        return self.transformer (racine, lambda valeur: abd (str (valeur)),
+                                 lambda niveau, faux, vrai: abd ("x" + str (niveau), faux, vrai))
+
+    def exporter (self, racine, gest=None):
+        """
+        Copie un ROBDD dans un gestionnaire sans arcs complémentés (cf. abd.compression_bdd())
+
+        Parameters
+        ----------
+        racine : int
+            La référence du ROBDD.
+        gest : gestionnaire, optional
+            Le gestionnaire dans lequel ranger le ROBDD. None par défaut (un nouveau gestionnaire).
+
+        Returns
+        -------
+        vue_abd
+            Le ROBDD.
+
+        """
+
+        g = gestionnaire () if gest is None else gest
+        res = self.transformer (racine, lambda valeur: VRAI if valeur else FAUX,
+                                lambda niveau, faux, vrai: g.construire (niveau, faux, vrai))
+        return vue_abd (g, res)
@@ -1,12 +1,140 @@
-from abd import *
+from abd import abd
+from gestionnaire import gestionnaire
+import math
 import numpy as np
 import random
-import matplotlib.pyplot as plt
 import time
+import os
+import itertools
+import pickle
+import statistiques
+import sys
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 
+# Les phases d'une expérimentation (cf. genere_abs_ord()) mesurées par profileur_memoire : le tirage
+# des fonctions, puis le calcul vectorisé des tailles jusqu'à 6 variables, la construction dans le
+# gestionnaire partagé et le comptage des noeuds au-delà (cf. histogramme())
+PHASES = ["tirage", "tailles_robdd", "cons_robdd", "nb_noeuds"]
 
+# Nombre de noeuds vivants au-delà duquel le gestionnaire partagé par les ROBDD d'une
+# expérimentation libère les noeuds des ROBDD déjà comptés (cf. gestionnaire.collecter())
+SEUIL_COLLECTE = 1 << 20
 
-def genere_abs_ord (nb_vars, nb_vals=10000):
+
+def tailles_robdd (entiers, nb_vars, taille_lot=65536):
+    """
+    Calcule d'un coup le nombre de noeuds (cf. abd.nb_noeuds()) des ROBDD d'un lot de fonctions booléennes.
+    Les noeuds de la variable x_k sont les sous-tables distinctes de taille 2^k dont les deux moitiés
+    diffèrent : elles sont comptées pour toutes les fonctions à la fois, niveau par niveau.
+
+    Parameters
+    ----------
+    entiers : array of int
+        Les entiers dont sont issues les tables de vérité (cf. table()).
+    nb_vars : int
+        Le nombre de variables (au plus 6, pour qu'une table tienne dans un entier de 64 bits).
+    taille_lot : int, optional
+        Le nombre de fonctions traitées ensemble (borne la mémoire utilisée). 65536 par défaut.
+
+    Returns
+    -------
+    array of int
+        Le nombre de noeuds du ROBDD de chaque fonction.
+
+    """
+    
+    nb_feuilles = 2 ** nb_vars
+    plein = np.uint64 ((1 << nb_feuilles) - 1)
+    vide = np.iinfo (np.uint64).max
+    entiers = np.asarray (entiers, dtype=np.uint64) & plein
+    res = np.empty (len (entiers), dtype=np.int64)
+    for debut in range (0, len (entiers), taille_lot):
+        lot = entiers [debut:debut + taille_lot]
+        tailles = 1 + ((lot != 0) & (lot != plein))
+        for k in range (1, nb_vars + 1):
+            largeur = 2 ** k
+            moitie = np.uint64 (largeur // 2)
+            decalages = np.arange (0, nb_feuilles, largeur, dtype=np.uint64)
+            sous_tables = (lot [:, None] >> decalages) & np.uint64 ((1 << largeur) - 1)
+            utiles = (sous_tables & np.uint64 ((1 << (largeur // 2)) - 1)) != (sous_tables >> moitie)
+            sous_tables = np.sort (np.where (utiles, sous_tables, vide), axis=1)
+            nouvelles = sous_tables != vide
+            nouvelles [:, 1:] &= sous_tables [:, 1:] != sous_tables [:, :-1]
+            tailles += nouvelles.sum (axis=1)
+        res [debut:debut + taille_lot] = tailles
+    return res
+
+def tailles_optimales (entiers, nb_vars, taille_lot=65536):
+    """
+    Calcule d'un coup, pour un lot de fonctions booléennes, la taille minimale de leur ROBDD sur tous
+    les ordres des variables et un ordre qui l'atteint (même programmation dynamique que
+    abd.ordre_optimal(), menée pour toutes les fonctions à la fois). Les sous-fonctions sur un ensemble
+    S de variables sont représentées par leur table de vérité, qui tient dans un entier de 64 bits.
+
+    Parameters
+    ----------
+    entiers : array of int
+        Les entiers dont sont issues les tables de vérité (cf. table()).
+    nb_vars : int
+        Le nombre de variables (au plus 6).
+    taille_lot : int, optional
+        Le nombre de fonctions traitées ensemble (borne la mémoire utilisée). 65536 par défaut.
+
+    Returns
+    -------
+    tailles : array of int
+        Le nombre minimal de noeuds du ROBDD de chaque fonction (cf. abd.nb_noeuds()).
+    ordres : array of int
+        Pour chaque fonction, les variables du niveau 1 jusqu'à la racine (cf. abd.ordre_optimal()).
+
+    """
+
+    nb_feuilles = 2 ** nb_vars
+    plein = np.uint64 ((1 << nb_feuilles) - 1)
+    vide = np.iinfo (np.uint64).max
+    entiers = np.asarray (entiers, dtype=np.uint64) & plein
+    tailles = np.empty (len (entiers), dtype=np.int64)
+    ordres = np.empty ((len (entiers), nb_vars), dtype=np.int64)
+    for debut in range (0, len (entiers), taille_lot):
+        lot = entiers [debut:debut + taille_lot]
+        lignes = np.arange (len (lot))
+        # sous_tables [S] : les sous-fonctions sur S, une colonne par affectation des autres variables
+        sous_tables = {0: (lot [:, None] >> np.arange (nb_feuilles, dtype=np.uint64)) & np.uint64 (1)}
+        couts = {0: 1 + ((lot != 0) & (lot != plein))}
+        choix = np.zeros ((nb_feuilles, len (lot)), dtype=np.int64)
+        for taille in range (1, nb_vars + 1):
+            suivantes = dict()
+            for variables in itertools.combinations (range (nb_vars), taille):
+                S = sum (1 << v for v in variables)
+                candidats = []
+                for v in reversed (variables):
+                    T = S & ~(1 << v)
+                    rang = bin (~T & ((1 << v) - 1)).count ("1")
+                    colonnes = sous_tables [T].reshape (len (lot), -1, 2, 2 ** rang)
+                    bas = colonnes [:, :, 0, :].reshape (len (lot), -1)
+                    haut = colonnes [:, :, 1, :].reshape (len (lot), -1)
+                    fusion = bas | (haut << np.uint64 (2 ** (taille - 1)))
+                    distinctes = np.sort (np.where (bas != haut, fusion, vide), axis=1)
+                    nouvelles = distinctes != vide
+                    nouvelles [:, 1:] &= distinctes [:, 1:] != distinctes [:, :-1]
+                    candidats.append (couts [T] + nouvelles.sum (axis=1))
+                candidats = np.array (candidats)
+                meilleurs = np.argmin (candidats, axis=0)
+                couts [S] = candidats [meilleurs, lignes]
+                choix [S] = np.array (variables [::-1]) [meilleurs]
+                suivantes [S] = fusion
+            sous_tables = suivantes
+        S = np.full (len (lot), nb_feuilles - 1)
+        for niveau in range (nb_vars - 1, -1, -1):
+            v = choix [S, lignes]
+            ordres [debut + lignes, niveau] = v + 1
+            S &= ~(1 << v)
+        tailles [debut:debut + taille_lot] = couts [nb_feuilles - 1]
+    return tailles, ordres
+
+def genere_abs_ord (nb_vars, nb_vals=10000, fichier_reprise=None, profil=None):
     """
     Génère les abcisses/ordonnées des points de la courbe (cf. Figure 9-10) représentant le nombre de noeuds 
     en fonction du nombre de fonctions booléennes selon un nombre de variable fixé.
@@ -17,6 +145,10 @@ def genere_abs_ord (nb_vars, nb_vals=10000):
         Le nombre de variables.
     nb_vals : int, optional
         L'échantillon désiré. 10000 par défaut.
+    fichier_reprise : string, optional
+        Le fichier de sauvegarde de l'échantillonnage (cf. histogramme_flux()). None par défaut.
+    profil : profileur_memoire, optional
+        Le profileur qui mesure la mémoire de chaque phase (cf. histogramme()). None par défaut.
 
     Returns
     -------
@@ -25,103 +157,381 @@ def genere_abs_ord (nb_vars, nb_vals=10000):
 
     """
      
+    compensation = 1
+    nb_feuilles = int (math.pow(2, nb_vars))
+    
+    with statistiques.portee ("genere_abs_ord (" + str (nb_vars) + " variables)"):
+        if nb_vars > 4:
+            borne = 2 ** nb_feuilles
+            dico = histogramme_flux (nb_vars, nb_vals, random, fichier_reprise, profil=profil)
+            compensation = borne // nb_vals
+        else:
+            entiers = [i for i in range (0, int(math.pow (2, nb_feuilles)))]
+            dico = histogramme (entiers, nb_vars, profil=profil)
+    return abscisses_ordonnees (dico, compensation)
+
+def histogramme (entiers, nb_vars, gest=None, profil=None):
+    """
+    Compte les fonctions booléennes selon le nombre de noeuds de leur ROBDD.
+    Au-delà de 6 variables, les ROBDD sont construits dans un même gestionnaire (une forêt à
+    plusieurs racines) : les sous-fonctions communes ne sont construites qu'une fois, et la taille
+    de chaque ROBDD est le nombre de noeuds accessibles depuis sa racine.
+
+    Parameters
+    ----------
+    entiers : list of int
+        Les entiers dont sont issues les tables de vérité (cf. table()).
+    nb_vars : int
+        Le nombre de variables.
+    gest : gestionnaire, optional
+        Le gestionnaire partagé. None par défaut (un nouveau gestionnaire pour cet appel).
+    profil : profileur_memoire, optional
+        Le profileur qui mesure la mémoire des phases tailles_robdd, cons_robdd et nb_noeuds
+        (cf. PHASES). None par défaut (aucune mesure).
+
+    Returns
+    -------
+    dico : dict
+        Associe à chaque nombre de noeuds le nombre de fonctions.
+
+    """
+    
+    dico = dict()
+    mesurer = sans_mesure if profil is None else profil.mesurer
+    if nb_vars <= 6:
+        tailles = mesurer ("tailles_robdd", tailles_robdd, entiers, nb_vars)
+        for n, occurrences in zip (*np.unique (tailles, return_counts=True)):
+            dico [int (n)] = int (occurrences)
+        return dico
+    nb_feuilles = 2 ** nb_vars
+    g = nouveau_gestionnaire_partage () if gest is None else gest
+    for i in entiers:
+        arbre = mesurer ("cons_robdd", abd.cons_robdd, i, nb_feuilles, g)
+        n = mesurer ("nb_noeuds", abd.nb_noeuds, arbre)
+        if n not in dico:
+            dico [n] = 1
+        else:
+            dico [n] += 1
+    return dico
+
+def nouveau_gestionnaire_partage ():
+    """
+    Crée le gestionnaire partagé par les ROBDD d'une expérimentation (cf. histogramme()), qui
+    libère les noeuds des ROBDD abandonnés quand il dépasse SEUIL_COLLECTE noeuds vivants
+
+    Returns
+    -------
+    gestionnaire
+        Le gestionnaire.
+
+    """
+
+    g = gestionnaire ()
+    g.seuil_collecte = SEUIL_COLLECTE
+    return g
+
+def fusionner_histogrammes (histogrammes):
+    """
+    Fusionne des histogrammes partiels (cf. histogramme())
+
+    Parameters
+    ----------
+    histogrammes : list of dict
+        Les histogrammes partiels.
+
+    Returns
+    -------
+    dico : dict
+        L'histogramme total.
+
+    """
+    
     dico = dict()
+    for partiel in histogrammes:
+        for taille, occurrences in partiel.items():
+            dico [taille] = dico.get (taille, 0) + occurrences
+    return dico
+
+def abscisses_ordonnees (dico, compensation=1):
+    """
+    Transforme un histogramme en abscisses/ordonnées de la courbe
+
+    Parameters
+    ----------
+    dico : dict
+        Associe à chaque nombre de noeuds le nombre de fonctions.
+    compensation : int, optional
+        Le facteur appliqué aux ordonnées quand l'histogramme vient d'un échantillon. 1 par défaut.
+
+    Returns
+    -------
+    (array of int, array of int)
+        Les abscisses et ordonnées de la courbe.
+
+    """
+    
     x = []
     y = []
-    compensation = 1
-    nb_feuilles = int (math.pow(2, nb_vars))
-    def puissance (x, n):
+    for taille, occurrences in sorted (dico.items()):
+        x.append (taille)
+        y.append (occurrences * compensation)
+    return (np.array (x), np.array (y))
+
+class filtre_bloom:
+    def __init__ (self, nb_elements, taux_erreur=0.01):
         """
-        Fonction puissance
+        Définition d'un filtre de Bloom : un ensemble approché d'entiers de taille fixe
+        (un élément absent est déclaré présent avec une probabilité d'environ taux_erreur)
 
         Parameters
         ----------
-        x : int
-            Un entier.
-        n : int
-            L'exposant.
+        nb_elements : int
+            Le nombre d'éléments prévus.
+        taux_erreur : float, optional
+            Le taux de faux positifs visé. 0.01 par défaut.
 
         Returns
         -------
-        int
-            La valeur de x^n.
+        None.
 
         """
         
-        def aux (x, n, acc):
-            """
-            Fonction récursive (auxiliaire de puissance())
-
-            Parameters
-            ----------
-            x : int
-                Un entier.
-            n : int
-                L'exposant.
-            acc : int
-                L'accumulateur.
-
-            Returns
-            -------
-            int
-                La valeur de x^n..
-
-            """
-            
-            if n == 0:
-                return acc
-            return aux (x, n - 1, acc * x)
-        return aux (x, n, 1)
-    
-    def generer_entiers_alea (nb_vals, nb_bits):
+        self.nb_bits = max (8, int (-nb_elements * math.log (taux_erreur) / math.log (2) ** 2))
+        self.nb_hachages = max (1, round (self.nb_bits / max (1, nb_elements) * math.log (2)))
+        self.bits = bytearray ((self.nb_bits + 7) // 8)
+
+    def ajouter (self, valeur):
         """
-        Génère des entiers aléatoires
+        Ajoute un entier au filtre
 
         Parameters
         ----------
-        nb_vals : int
-            Le nombre de valeur à générer.
-        nb_bits : int
-            Le nombre de bit maximum des entiers générés.
+        valeur : int
+            L'entier à ajouter.
 
         Returns
         -------
-        res : list of int
-            La liste des entiers générés aléatoirement.
+        bool
+            True si l'entier n'était pas (a priori) déjà dans le filtre, False sinon.
 
         """
         
-        res = [0]         
-        while nb_vals > 0:
-            val = random.getrandbits (nb_bits) 
-            if val not in res:
-                res.append (val)
-                nb_vals -= 1
-        return res
+        h1 = hash (valeur)
+        h2 = hash ((valeur, 0x9E3779B9)) | 1
+        nouveau = False
+        for i in range (self.nb_hachages):
+            position = (h1 + i * h2) % self.nb_bits
+            octet, bit = position >> 3, 1 << (position & 7)
+            if not self.bits [octet] & bit:
+                self.bits [octet] |= bit
+                nouveau = True
+        return nouveau
+
+def tirer_entiers (nb_bits, alea):
+    """
+    Génère indéfiniment des entiers aléatoires
+
+    Parameters
+    ----------
+    nb_bits : int
+        Le nombre de bit maximum des entiers générés.
+    alea : random.Random
+        Le générateur aléatoire (ou le module random).
+
+    Yields
+    ------
+    int
+        Un entier aléatoire.
+
+    """
     
-    if nb_vars > 4:
-        borne = puissance (2, nb_feuilles)
-        entiers = generer_entiers_alea(nb_vals - 1, nb_feuilles)
-        compensation = borne // nb_vals
+    while True:
+        yield alea.getrandbits (nb_bits)
+
+def sans_doublons (entiers, filtre):
+    """
+    Filtre les entiers déjà rencontrés
+
+    Parameters
+    ----------
+    entiers : iterator of int
+        Les entiers.
+    filtre : filtre_bloom
+        Les entiers déjà rencontrés (mis à jour au fur et à mesure).
+
+    Yields
+    ------
+    int
+        Les entiers pas encore rencontrés.
+
+    """
+    
+    for entier in entiers:
+        if filtre.ajouter (entier):
+            yield entier
+
+def histogramme_flux (nb_vars, nb_vals, alea=random, fichier_reprise=None, periode=65536, gest=None, profil=None):
+    """
+    Histogramme d'un échantillon de nb_vals fonctions distinctes (dont la fonction nulle),
+    tirées, dédoublonnées et comptées au fil de l'eau par lots de periode fonctions :
+    la mémoire utilisée ne dépend pas de la taille de l'échantillon (hormis le filtre de Bloom).
+    Après chaque lot, l'état du calcul est sauvegardé dans fichier_reprise : un calcul
+    interrompu reprend là où il s'était arrêté. Le fichier est supprimé à la fin.
+
+    Parameters
+    ----------
+    nb_vars : int
+        Le nombre de variables.
+    nb_vals : int
+        L'échantillon désiré.
+    alea : random.Random, optional
+        Le générateur aléatoire. Le module random par défaut.
+    fichier_reprise : string, optional
+        Le fichier de sauvegarde. None par défaut (pas de sauvegarde).
+    periode : int, optional
+        Le nombre de fonctions entre deux sauvegardes. 65536 par défaut.
+    gest : gestionnaire, optional
+        Le gestionnaire partagé par tous les lots (cf. histogramme()). None par défaut (un nouveau
+        gestionnaire partagé).
+    profil : profileur_memoire, optional
+        Le profileur qui mesure la mémoire du tirage de chaque lot et des phases de histogramme().
+        None par défaut (aucune mesure).
+
+    Returns
+    -------
+    dico : dict
+        Associe à chaque nombre de noeuds le nombre de fonctions.
+
+    """
+    
+    if gest is None and nb_vars > 6:
+        gest = nouveau_gestionnaire_partage ()
+    if fichier_reprise is not None and os.path.exists (fichier_reprise):
+        with open (fichier_reprise, "rb") as f:
+            etat = pickle.load (f)
+        if (etat ["nb_vars"], etat ["nb_vals"]) != (nb_vars, nb_vals):
+            raise ValueError ("Le fichier de reprise " + fichier_reprise + " correspond à une autre expérimentation")
+        filtre = etat ["filtre"]
+        dico = etat ["histogramme"]
+        nb_faits = etat ["nb_faits"]
+        alea.setstate (etat ["alea"])
     else:
-        entiers = [i for i in range (0, int(math.pow (2, nb_feuilles)))]
-        
-    for i in entiers:
-        arbre = abd.cons_arbre(table(i,nb_feuilles)) 
-        arbre2 = abd.luka(arbre)
-        arbre3 = abd.compression_bdd(arbre2)
-        n = abd.nb_noeuds (arbre3)
-        if n not in dico:
-            dico [n] = 1
+        filtre = filtre_bloom (nb_vals)
+        filtre.ajouter (0)
+        dico = histogramme ([0], nb_vars, gest, profil)
+        nb_faits = 1
+    entiers = sans_doublons (tirer_entiers (2 ** nb_vars, alea), filtre)
+    mesurer = sans_mesure if profil is None else profil.mesurer
+    while nb_faits < nb_vals:
+        lot = mesurer ("tirage", lambda: list (itertools.islice (entiers, min (periode, nb_vals - nb_faits))))
+        dico = fusionner_histogrammes ([dico, histogramme (lot, nb_vars, gest, profil)])
+        nb_faits += len (lot)
+        if fichier_reprise is not None:
+            etat = {"nb_vars": nb_vars, "nb_vals": nb_vals, "filtre": filtre, "histogramme": dico,
+                    "nb_faits": nb_faits, "alea": alea.getstate ()}
+            with open (fichier_reprise + ".tmp", "wb") as f:
+                pickle.dump (etat, f)
+            os.replace (fichier_reprise + ".tmp", fichier_reprise)
+    if fichier_reprise is not None and os.path.exists (fichier_reprise):
+        os.remove (fichier_reprise)
+    return dico
+
+def histogramme_tranche (nb_vars, debut, fin):
+    """
+    Histogramme des fonctions dont les entiers sont dans [debut, fin[ (tâche d'un processus)
+
+    Parameters
+    ----------
+    nb_vars : int
+        Le nombre de variables.
+    debut : int
+        Le premier entier de la tranche.
+    fin : int
+        L'entier qui suit le dernier de la tranche.
+
+    Returns
+    -------
+    dict
+        L'histogramme partiel.
+
+    """
+    
+    if nb_vars <= 6:
+        return histogramme (np.arange (debut, fin, dtype=np.uint64), nb_vars)
+    return histogramme (range (debut, fin), nb_vars)
+
+def histogramme_echantillon (nb_vars, nb_vals, indice, nb_parts, graine):
+    """
+    Histogramme de nb_vals fonctions distinctes tirées au hasard parmi celles dont l'entier
+    est congru à indice modulo nb_parts (tâche d'un processus : les parts sont disjointes)
+
+    Parameters
+    ----------
+    nb_vars : int
+        Le nombre de variables.
+    nb_vals : int
+        Le nombre de fonctions à tirer.
+    indice : int
+        Le numéro de la part.
+    nb_parts : int
+        Le nombre de parts.
+    graine : int
+        La graine commune du tirage (celle de la part en est déduite).
+
+    Returns
+    -------
+    dict
+        L'histogramme partiel.
+
+    """
+    
+    alea = random.Random (graine * nb_parts + indice)
+    borne = 2 ** (2 ** nb_vars)
+    entiers = set()
+    if indice == 0:
+        entiers.add (0)
+    while len (entiers) < nb_vals:
+        entiers.add (alea.randrange (indice, borne, nb_parts))
+    return histogramme (list (entiers), nb_vars)
+
+def genere_abs_ord_parallele (nb_vars, nb_vals=10000, nb_processus=None, graine=0):
+    """
+    Comme genere_abs_ord(), en répartissant les fonctions entre plusieurs processus.
+    L'énumération est découpée en tranches d'entiers consécutifs, l'échantillon en parts
+    (une classe modulo le nombre de processus chacune, avec sa propre graine).
+
+    Parameters
+    ----------
+    nb_vars : int
+        Le nombre de variables.
+    nb_vals : int, optional
+        L'échantillon désiré. 10000 par défaut.
+    nb_processus : int, optional
+        Le nombre de processus. None par défaut (le nombre de processeurs).
+    graine : int, optional
+        La graine du tirage aléatoire. 0 par défaut.
+
+    Returns
+    -------
+    (array of int, array of int)
+        Les abcisses et ordonnées de la courbe.
+
+    """
+    
+    if nb_processus is None:
+        nb_processus = os.cpu_count ()
+    borne = 2 ** (2 ** nb_vars)
+    compensation = 1
+    with ProcessPoolExecutor (nb_processus) as executeur:
+        if nb_vars > 4:
+            compensation = borne // nb_vals
+            taches = [executeur.submit (histogramme_echantillon, nb_vars, nb_vals // nb_processus + (i < nb_vals % nb_processus),
+                                        i, nb_processus, graine) for i in range (nb_processus)]
         else:
-            dico [n] += 1
-    dico = sorted (dico.items())
-    for taille, occurrences in dico:
-        x.append (taille)
-        y.append (occurrences * compensation)
-    x = np.array(x)
-    y = np.array(y)
-    return (x, y)
+            bornes = [borne * i // nb_processus for i in range (nb_processus + 1)]
+            taches = [executeur.submit (histogramme_tranche, nb_vars, bornes [i], bornes [i + 1]) for i in range (nb_processus)]
+        dico = fusionner_histogrammes (tache.result () for tache in taches)
+    return abscisses_ordonnees (dico, compensation)
 
 def genere_graphe (nb_vars, nb_vals):
     """
@@ -143,6 +553,7 @@ def genere_graphe (nb_vars, nb_vals):
     """
     
     x, y = genere_abs_ord (nb_vars, nb_vals)
+    import matplotlib.pyplot as plt
     plt.plot (x, y, "b:o")
     plt.title ("Nombre de noeuds des ROBDD pour " + str (nb_vars) + " variables")
     plt.xlabel ("Nombre de noeuds")
@@ -151,7 +562,85 @@ def genere_graphe (nb_vars, nb_vals):
     plt.xlim (0, maxx)
     return plt.show()
 
-def genere_stats (nb_vars, nb_vals):
+def histogrammes_ordre_optimal (nb_vars, nb_vals=10000, alea=random):
+    """
+    Compte les fonctions booléennes selon le nombre de noeuds de leur ROBDD dans l'ordre naturel
+    et dans le meilleur ordre des variables (cf. abd.ordre_optimal())
+
+    Parameters
+    ----------
+    nb_vars : int
+        Le nombre de variables.
+    nb_vals : int, optional
+        L'échantillon désiré, de fonctions distinctes comme pour histogramme_flux() (toutes les
+        fonctions sont prises jusqu'à 4 variables). 10000 par défaut.
+    alea : random.Random, optional
+        Le générateur aléatoire (ou le module random). random par défaut.
+
+    Returns
+    -------
+    naturel : dict
+        Associe à chaque nombre de noeuds dans l'ordre naturel le nombre de fonctions.
+    optimal : dict
+        Associe à chaque nombre de noeuds dans le meilleur ordre le nombre de fonctions.
+    compensation : int
+        Le facteur à appliquer aux ordonnées (cf. abscisses_ordonnees()).
+
+    """
+
+    nb_feuilles = 2 ** nb_vars
+    if nb_vars > 4:
+        entiers = list (itertools.islice (sans_doublons (tirer_entiers (nb_feuilles, alea), filtre_bloom (nb_vals)), nb_vals))
+        compensation = 2 ** nb_feuilles // nb_vals
+    else:
+        entiers = list (range (2 ** nb_feuilles))
+        compensation = 1
+    naturel = histogramme (entiers, nb_vars)
+    optimal = dict()
+    if nb_vars <= 6:
+        tailles, _ = tailles_optimales (entiers, nb_vars)
+        for n, occurrences in zip (*np.unique (tailles, return_counts=True)):
+            optimal [int (n)] = int (occurrences)
+    else:
+        for i in entiers:
+            _, n = abd.ordre_optimal (i, nb_feuilles)
+            optimal [n] = optimal.get (n, 0) + 1
+    return naturel, optimal, compensation
+
+def genere_graphe_ordre_optimal (nb_vars, nb_vals=10000):
+    """
+    Génère les histogrammes du nombre de noeuds des ROBDD dans l'ordre naturel et dans le meilleur
+    ordre des variables, selon un nombre de variables fixé.
+
+    Parameters
+    ----------
+    nb_vars : int
+        Nombre de variables.
+    nb_vals : int, optional
+        L'échantillon désiré. 10000 par défaut.
+
+    Returns
+    -------
+    function
+        Les deux histogrammes.
+
+    """
+
+    naturel, optimal, compensation = histogrammes_ordre_optimal (nb_vars, nb_vals)
+    import matplotlib.pyplot as plt
+    x, y = abscisses_ordonnees (naturel, compensation)
+    plt.plot (x, y, "b:o", label="Ordre naturel")
+    x, y = abscisses_ordonnees (optimal, compensation)
+    plt.plot (x, y, "r:o", label="Meilleur ordre")
+    plt.title ("Nombre de noeuds des ROBDD pour " + str (nb_vars) + " variables")
+    plt.xlabel ("Nombre de noeuds")
+    plt.ylabel ("Nombre de fonctions booléennes")
+    plt.legend ()
+    minx, maxx = plt.xlim()
+    plt.xlim (0, maxx)
+    return plt.show()
+
+def genere_stats (nb_vars, nb_vals, nb_processus=1):
     """
     Génère les stats d'une expérimentation (conformément à la figure 10)
 
@@ -161,6 +650,8 @@ def genere_stats (nb_vars, nb_vals):
         Nombre de variables.
     nb_vals : int
         L'échantillon désiré.
+    nb_processus : int, optional
+        Le nombre de processus (cf. genere_abs_ord_parallele()). 1 par défaut.
 
     Returns
     -------
@@ -178,13 +669,248 @@ def genere_stats (nb_vars, nb_vals):
     """
     
     debut = time.time()
-    x, _ = genere_abs_ord (nb_vars, nb_vals)
+    if nb_processus > 1:
+        x, _ = genere_abs_ord_parallele (nb_vars, nb_vals, nb_processus)
+    else:
+        x, _ = genere_abs_ord (nb_vars, nb_vals)
     fin = time.time()
     temps = fin - debut
     temps_par_robdd = temps / nb_vals
     return (nb_vars, nb_vals, len (x), temps, temps_par_robdd)
 
-def genere_stats_et_graphe (nb_vars, nb_vals, fichier):
+def sans_mesure (phase, calcul, *args):
+    """
+    Exécute une phase sans la mesurer (cf. profileur_memoire.mesurer())
+
+    Parameters
+    ----------
+    phase : string
+        Le nom de la phase (cf. PHASES).
+    calcul : function
+        La phase.
+    *args
+        Les arguments de calcul.
+
+    Returns
+    -------
+    object
+        Le résultat de calcul.
+
+    """
+
+    return calcul (*args)
+
+class profileur_memoire:
+    def __init__ (self, plafond=None, nb_sites=10, flux=sys.stderr, periode=0.01):
+        """
+        Définition d'un profileur de la mémoire des phases d'une expérimentation (cf. PHASES),
+        passé à genere_abs_ord(), histogramme_flux() ou histogramme() entre demarrer() et arreter().
+        Pour chaque exécution d'une phase, tracemalloc donne le pic (la mémoire allouée au plus
+        fort de la phase) et la mémoire retenue (celle encore allouée à la fin de la phase,
+        essentiellement son résultat ; pour cons_robdd, les noeuds ajoutés au gestionnaire partagé).
+        Pendant chaque phase, la mémoire suivie est relevée toutes les periode secondes : dès qu'elle
+        dépasse le plafond, les principaux sites d'allocation sont écrits dans le flux (une fois par
+        phase), pendant que la mémoire est encore allouée, et le flux est vidé : le diagnostic reste
+        même si le processus est tué ensuite faute de mémoire. Une phase trop courte pour être
+        relevée est signalée à sa fin si son pic a dépassé le plafond.
+
+        Parameters
+        ----------
+        plafond : int, optional
+            Le plafond de mémoire (en octets). None par défaut (aucun plafond).
+        nb_sites : int, optional
+            Le nombre de sites d'allocation écrits quand le plafond est dépassé. 10 par défaut.
+        flux : file, optional
+            Le flux où écrire les sites d'allocation. sys.stderr par défaut.
+        periode : float, optional
+            L'intervalle (en secondes) entre deux relevés de la mémoire. 0.01 par défaut.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.plafond = plafond
+        self.nb_sites = nb_sites
+        self.flux = flux
+        self.periode = periode
+        # Associe à chaque phase la liste de ses mesures (pic, mémoire retenue), en octets
+        self.profils = {phase: [] for phase in PHASES}
+        self.en_cours = None
+        self.alertes = set()
+        self.arret = threading.Event ()
+        self.surveillant = None
+        self.demarre = False
+
+    def demarrer (self):
+        """
+        Démarre le suivi de la mémoire (et sa surveillance si un plafond est fixé)
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.demarre = not tracemalloc.is_tracing ()
+        if self.demarre:
+            tracemalloc.start ()
+        if self.plafond is not None:
+            self.arret.clear ()
+            self.surveillant = threading.Thread (target=self.surveiller, daemon=True)
+            self.surveillant.start ()
+
+    def arreter (self):
+        """
+        Arrête la surveillance et le suivi de la mémoire (s'il a été démarré par demarrer())
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.arret.set ()
+        if self.surveillant is not None:
+            self.surveillant.join ()
+            self.surveillant = None
+        if self.demarre:
+            tracemalloc.stop ()
+            self.demarre = False
+
+    def mesurer (self, phase, calcul, *args):
+        """
+        Exécute une phase en mesurant sa mémoire
+
+        Parameters
+        ----------
+        phase : string
+            Le nom de la phase (cf. PHASES).
+        calcul : function
+            La phase.
+        *args
+            Les arguments de calcul.
+
+        Returns
+        -------
+        object
+            Le résultat de calcul.
+
+        """
+
+        avant = tracemalloc.get_traced_memory () [0]
+        tracemalloc.reset_peak ()
+        self.en_cours = phase
+        resultat = calcul (*args)
+        courant, pic = tracemalloc.get_traced_memory ()
+        self.en_cours = None
+        self.profils [phase].append ((pic - avant, courant - avant))
+        if self.plafond is not None and pic > self.plafond and phase not in self.alertes:
+            self.alerter (phase, pic, "en fin de phase")
+        return resultat
+
+    def alerter (self, phase, memoire, moment):
+        """
+        Ecrit dans le flux les principaux sites d'allocation, une fois par phase
+
+        Parameters
+        ----------
+        phase : string
+            La phase qui a dépassé le plafond.
+        memoire : int
+            La mémoire suivie (en octets).
+        moment : string
+            Le moment du relevé.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.alertes.add (phase)
+        self.flux.write ("Plafond de " + str (self.plafond) + " octets dépassé (" + str (memoire) + ") pendant "
+                         + phase + " (exécution " + str (len (self.profils [phase]) + 1)
+                         + "), principaux sites d'allocation " + moment + " :\n")
+        for site in tracemalloc.take_snapshot ().statistics ("lineno") [:self.nb_sites]:
+            self.flux.write ("    " + str (site) + "\n")
+        self.flux.flush ()
+
+    def surveiller (self):
+        """
+        Relève la mémoire suivie toutes les self.periode secondes jusqu'à arreter() (exécuté
+        dans un fil à part)
+
+        Returns
+        -------
+        None.
+
+        """
+
+        while not self.arret.wait (self.periode):
+            phase = self.en_cours
+            if phase is None or phase in self.alertes:
+                continue
+            memoire = tracemalloc.get_traced_memory () [0]
+            if memoire > self.plafond:
+                self.alerter (phase, memoire, "au dépassement")
+
+    def maxima (self):
+        """
+        Retourne le plus grand pic et la plus grande mémoire retenue de chaque phase
+
+        Returns
+        -------
+        dict
+            Associe à chaque phase (cf. PHASES) ces deux valeurs en octets (0 pour une phase qui
+            ne s'est pas exécutée).
+
+        """
+
+        return {phase: (max ((pic for pic, _ in mesures), default=0), max ((retenue for _, retenue in mesures), default=0))
+                for phase, mesures in self.profils.items ()}
+
+def profil_memoire (nb_vars, nb_fonctions=100, alea=random, plafond=None, nb_sites=10, flux=sys.stderr, periode=0.01):
+    """
+    Mesure la mémoire de chaque phase (cf. profileur_memoire) pour un échantillon de fonctions
+    booléennes tirées au hasard et traitées comme par histogramme_flux()
+
+    Parameters
+    ----------
+    nb_vars : int
+        Le nombre de variables.
+    nb_fonctions : int, optional
+        Le nombre de fonctions mesurées. 100 par défaut.
+    alea : random.Random, optional
+        Le générateur aléatoire (ou le module random). random par défaut.
+    plafond : int, optional
+        Le plafond de mémoire (en octets). None par défaut (aucun plafond).
+    nb_sites : int, optional
+        Le nombre de sites d'allocation écrits quand le plafond est dépassé. 10 par défaut.
+    flux : file, optional
+        Le flux où écrire les sites d'allocation. sys.stderr par défaut.
+    periode : float, optional
+        L'intervalle (en secondes) entre deux relevés de la mémoire. 0.01 par défaut.
+
+    Returns
+    -------
+    dict
+        Associe à chaque phase la liste de ses mesures (pic, mémoire retenue), en octets : une par
+        fonction pour cons_robdd et nb_noeuds, une par lot pour tirage et tailles_robdd.
+        Les phases qui ne s'exécutent pas pour ce nombre de variables ont une liste vide.
+
+    """
+
+    profil = profileur_memoire (plafond, nb_sites, flux, periode)
+    profil.demarrer ()
+    try:
+        histogramme_flux (nb_vars, nb_fonctions, alea, profil=profil)
+    finally:
+        profil.arreter ()
+    return profil.profils
+
+def genere_stats_et_graphe (nb_vars, nb_vals, fichier, nb_processus=1, profil=False, plafond_memoire=None):
     """
     Construit le fichier avec les stats et construit l'histogramme de l'experimentation.
 
@@ -196,6 +922,16 @@ def genere_stats_et_graphe (nb_vars, nb_vals, fichier):
         L'échantillon désiré.
     fichier : string
         Le fichier.
+    nb_processus : int, optional
+        Le nombre de processus (cf. genere_abs_ord_parallele()). 1 par défaut.
+    profil : bool, optional
+        Mesure la mémoire de chaque phase pendant l'expérimentation elle-même (cf. profileur_memoire,
+        les temps comprennent alors le coût de tracemalloc) et ajoute après les colonnes de temps,
+        pour chaque phase (cf. PHASES), le plus grand pic et la plus grande mémoire retenue
+        (en octets, 0 pour une phase qui ne s'exécute pas). Un seul processus. False par défaut.
+    plafond_memoire : int, optional
+        Le plafond de mémoire (en octets) au-delà duquel les principaux sites d'allocation sont
+        écrits sur la sortie d'erreur pendant l'expérimentation (avec profil). None par défaut.
 
     Returns
     -------
@@ -204,14 +940,32 @@ def genere_stats_et_graphe (nb_vars, nb_vals, fichier):
 
     """
     
+    if profil and nb_processus > 1:
+        raise ValueError ("Le profil de la mémoire n'est possible qu'avec un seul processus")
+    profileur = profileur_memoire (plafond_memoire) if profil else None
     f = open (fichier, "a")
     debut = time.time()
-    x, y = genere_abs_ord (nb_vars, nb_vals)
+    if nb_processus > 1:
+        x, y = genere_abs_ord_parallele (nb_vars, nb_vals, nb_processus)
+    elif profileur is None:
+        x, y = genere_abs_ord (nb_vars, nb_vals)
+    else:
+        profileur.demarrer ()
+        try:
+            x, y = genere_abs_ord (nb_vars, nb_vals, profil=profileur)
+        finally:
+            profileur.arreter ()
     fin = time.time()
     temps = fin - debut
     temps_par_robdd = temps / nb_vals
-    f.write (str (nb_vars) + ";" + str (nb_vals) + ";" + str (len (x)) + ";" + str (temps) + ";" + str (temps_par_robdd) + "\n")
+    ligne = str (nb_vars) + ";" + str (nb_vals) + ";" + str (len (x)) + ";" + str (temps) + ";" + str (temps_par_robdd)
+    if profileur is not None:
+        maxima = profileur.maxima ()
+        for phase in PHASES:
+            ligne += ";" + str (maxima [phase] [0]) + ";" + str (maxima [phase] [1])
+    f.write (ligne + "\n")
     f.close()
+    import matplotlib.pyplot as plt
     plt.plot (x, y, "b:o")
     plt.title ("Nombre de noeuds des ROBDD pour " + str (nb_vars) + " variables")
     plt.xlabel ("Nombre de noeuds")
@@ -0,0 +1,1509 @@
+from array import array
+import mmap
+import struct
+import sys
+
+FAUX = 0
+VRAI = 1
+
+# Format binaire des ROBDD sauvegardés (cf. gestionnaire.sauvegarder()) : un en-tête (signature,
+# version, nombre de niveaux, nombre de noeuds, racine), la variable de chaque niveau (0 compris),
+# puis un enregistrement de trois entiers 32 bits (niveau, fils faux, fils vrai) par noeud,
+# les fils avant les pères, le tout en petit-boutiste. La version 1 n'a pas la liste des variables
+# (ordre naturel : la variable x_i est au niveau i).
+SIGNATURE = b"ROBD"
+VERSION = 2
+ENTETE = struct.Struct ("<4sIIII")
+
+# Profondeur maximale des if imbriqués dans le code généré par gestionnaire.compiler()
+# (l'analyseur de Python limite l'indentation à 100 niveaux)
+PROFONDEUR_MAX_CODE = 50
+
+# Un opérateur binaire est codé par sa table de vérité sur 4 bits :
+# le bit 2 * a + b donne le résultat de l'opérateur appliqué à (a, b).
+OPERATEURS = {
+    "et": 0b1000,
+    "ou": 0b1110,
+    "xor": 0b0110,
+    "nand": 0b0111,
+    "implique": 0b1011,
+    "equiv": 0b1001,
+}
+
+
+def code_operateur (op):
+    """
+    Retourne le code sur 4 bits d'un opérateur binaire
+
+    Parameters
+    ----------
+    op : string, int ou fonction
+        Le nom de l'opérateur (cf. OPERATEURS), son code, ou un opérateur prenant
+        deux tables de vérité sous forme de string (comme et()).
+
+    Returns
+    -------
+    int
+        Le code de l'opérateur.
+
+    """
+
+    if isinstance (op, str):
+        return OPERATEURS [op]
+    if isinstance (op, int):
+        return op
+    res = op ("0011", "0101")
+    return sum (1 << i for i in range (4) if res [i] == "1")
+
+
+class gestionnaire:
+    def __init__ (self, taille_table=1024):
+        """
+        Définition d'un gestionnaire de noeuds de ROBDD.
+        Les noeuds sont rangés dans trois tableaux d'entiers parallèles (niveau, fils faux,
+        fils vrai) et sont désignés par leur indice dans ces tableaux. Les indices 0 et 1 sont
+        réservés aux feuilles False et True (niveau 0, chaque feuille est son propre fils).
+        Le niveau d'un noeud croît vers la racine ; la variable placée à chaque niveau est donnée
+        par self.ordre (et le niveau de chaque variable par self.positions). Au-delà de ces
+        tableaux, et tant que l'ordre n'a pas été changé (cf. tamiser()), x_i est au niveau i.
+        Un noeud libéré (cf. tamiser()) a ses deux fils égaux à FAUX, ce qu'aucun noeud ne peut avoir ;
+        son indice, rangé dans self.libres, est réutilisé par noeud().
+
+        Parameters
+        ----------
+        taille_table : int, optional
+            La taille initiale de la table unique (une puissance de 2). 1024 par défaut.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.niveaux = array ("i", [0, 0])
+        self.faux = array ("i", [FAUX, VRAI])
+        self.vrai = array ("i", [FAUX, VRAI])
+        self.table = array ("i", bytes (4 * taille_table))
+        # Table de calcul : chaque clé est un tuple (opérateur ou nom de l'opération, noeuds...)
+        self.cache = dict()
+        self.lecture_seule = False
+        self.ordre = array ("i", [0])
+        self.positions = array ("i", [0])
+        # Nombre de vue_abd sur chaque noeud : les racines à conserver lors d'un tamisage
+        self.racines = dict()
+        # Indices des noeuds libérés, réutilisés par noeud()
+        self.libres = []
+        # Nombre de cases non vides de la table unique (noeuds et cases libérées par retirer())
+        self.nb_occupees = 0
+        self.seuil_tamisage = None
+        # Tailles (avant, après) du dernier tamisage, qu'il ait été demandé ou automatique (cf. tamiser())
+        self.dernier_tamisage = None
+        self.seuil_collecte = None
+
+    def __len__ (self):
+        """
+        Retourne le nombre de noeuds du gestionnaire (feuilles comprises)
+
+        Returns
+        -------
+        int
+            Le nombre de noeuds.
+
+        """
+
+        return len (self.niveaux)
+
+    def noeud (self, niveau, faux, vrai):
+        """
+        Retourne le noeud (niveau, faux, vrai), en le créant s'il n'existe pas encore.
+        La table unique est une table de hachage à adressage ouvert qui contient les indices
+        des noeuds (0 pour une case vide, 1 pour une case libérée par retirer() : les feuilles
+        n'y sont jamais rangées).
+
+        Parameters
+        ----------
+        niveau : int
+            Le niveau du noeud, supérieur à ceux de ses fils (cf. construire() pour une variable).
+        faux : int
+            L'indice du fils faux.
+        vrai : int
+            L'indice du fils vrai.
+
+        Returns
+        -------
+        int
+            L'indice du noeud, ou celui de son fils si les deux fils sont égaux.
+
+        """
+
+        if faux == vrai:
+            return faux
+        if self.table is None:
+            if self.lecture_seule:
+                raise ValueError ("Impossible de créer un noeud dans un gestionnaire en lecture seule")
+            taille = 1024
+            while taille < 2 * len (self.niveaux):
+                taille *= 2
+            self.reconstruire_table (taille)
+        table = self.table
+        masque = len (table) - 1
+        h = hash ((niveau, faux, vrai)) & masque
+        noeud = table [h]
+        while noeud:
+            if self.faux [noeud] == faux and self.vrai [noeud] == vrai and self.niveaux [noeud] == niveau:
+                return noeud
+            h = (h + 1) & masque
+            noeud = table [h]
+        if self.libres:
+            noeud = self.libres.pop ()
+            self.niveaux [noeud] = niveau
+            self.faux [noeud] = faux
+            self.vrai [noeud] = vrai
+        else:
+            noeud = len (self.niveaux)
+            self.niveaux.append (niveau)
+            self.faux.append (faux)
+            self.vrai.append (vrai)
+        table [h] = noeud
+        self.nb_occupees += 1
+        if 2 * self.nb_occupees > masque:
+            self.reconstruire_table (self.taille_table ())
+        return noeud
+
+    def taille_table (self, reduire=False):
+        """
+        Retourne la taille à donner à la table unique pour que les noeuds en occupent au plus le quart
+
+        Parameters
+        ----------
+        reduire : bool, optional
+            Si True, la taille peut être inférieure à celle de la table actuelle (après une
+            libération de noeuds, cf. collecter()). False par défaut.
+
+        Returns
+        -------
+        int
+            La taille (une puissance de 2, au moins celle de la table actuelle si reduire est False).
+
+        """
+
+        taille = len (self.table) if self.table is not None and not reduire else 1024
+        while 4 * (len (self.niveaux) - len (self.libres)) > taille:
+            taille *= 2
+        return taille
+
+    def reconstruire_table (self, taille):
+        """
+        Reconstruit la table unique avec une nouvelle taille et y range à nouveau tous les noeuds
+        (sauf les noeuds libérés)
+
+        Parameters
+        ----------
+        taille : int
+            La nouvelle taille de la table (une puissance de 2).
+
+        Returns
+        -------
+        None.
+
+        """
+
+        table = array ("i", bytes (4 * taille))
+        masque = taille - 1
+        niveaux = self.niveaux
+        faux = self.faux
+        vrai = self.vrai
+        nb_occupees = 0
+        for noeud in range (2, len (niveaux)):
+            if faux [noeud] == vrai [noeud]:
+                continue
+            h = hash ((niveaux [noeud], faux [noeud], vrai [noeud])) & masque
+            while table [h]:
+                h = (h + 1) & masque
+            table [h] = noeud
+            nb_occupees += 1
+        self.table = table
+        self.nb_occupees = nb_occupees
+
+    def retirer (self, noeud):
+        """
+        Retire un noeud de la table unique (sa case est marquée libérée), avant de le modifier
+        ou de le libérer
+
+        Parameters
+        ----------
+        noeud : int
+            L'indice du noeud.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        table = self.table
+        masque = len (table) - 1
+        h = hash ((self.niveaux [noeud], self.faux [noeud], self.vrai [noeud])) & masque
+        while table [h] != noeud:
+            if not table [h]:
+                return
+            h = (h + 1) & masque
+        table [h] = VRAI
+
+    def inserer (self, noeud):
+        """
+        Range dans la table unique un noeud qui n'y est pas (après l'avoir modifié)
+
+        Parameters
+        ----------
+        noeud : int
+            L'indice du noeud.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        table = self.table
+        masque = len (table) - 1
+        h = hash ((self.niveaux [noeud], self.faux [noeud], self.vrai [noeud])) & masque
+        while table [h] > VRAI:
+            h = (h + 1) & masque
+        if not table [h]:
+            self.nb_occupees += 1
+        table [h] = noeud
+        if 2 * self.nb_occupees > masque:
+            self.reconstruire_table (self.taille_table ())
+
+    def niveau (self, variable):
+        """
+        Retourne le niveau d'une variable dans l'ordre courant
+
+        Parameters
+        ----------
+        variable : int
+            Le numéro i de la variable x_i.
+
+        Returns
+        -------
+        int
+            Son niveau.
+
+        """
+
+        if variable < len (self.positions):
+            return self.positions [variable]
+        return variable
+
+    def variable (self, niveau):
+        """
+        Retourne la variable placée à un niveau dans l'ordre courant
+
+        Parameters
+        ----------
+        niveau : int
+            Le niveau.
+
+        Returns
+        -------
+        int
+            Le numéro i de la variable x_i.
+
+        """
+
+        if niveau < len (self.ordre):
+            return self.ordre [niveau]
+        return niveau
+
+    def ordre_naturel (self):
+        """
+        Indique si chaque variable x_i est au niveau i
+
+        Returns
+        -------
+        bool
+            True si l'ordre est l'ordre naturel.
+
+        """
+
+        return all (variable == niveau for niveau, variable in enumerate (self.ordre))
+
+    def naturel (self, racine):
+        """
+        Retourne un ROBDD dans un gestionnaire dont l'ordre est l'ordre naturel : le même
+        si c'est déjà le cas, une copie dans un nouveau gestionnaire sinon
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+
+        Returns
+        -------
+        gestionnaire
+            Le gestionnaire.
+        int
+            L'indice du ROBDD dans ce gestionnaire.
+
+        """
+
+        if self.ordre_naturel ():
+            return self, racine
+        g = gestionnaire ()
+        return g, g.importer (self, racine)
+
+    def construire (self, variable, faux, vrai):
+        """
+        Retourne le ROBDD de "si x_variable alors vrai sinon faux", quels que soient les niveaux
+        des fils : un seul noeud si la variable est au-dessus d'eux, ite() sinon.
+
+        Parameters
+        ----------
+        variable : int
+            Le numéro i de la variable x_i.
+        faux : int
+            L'indice du ROBDD pour x_i faux.
+        vrai : int
+            L'indice du ROBDD pour x_i vrai.
+
+        Returns
+        -------
+        int
+            L'indice du ROBDD.
+
+        """
+
+        niveau = self.niveau (variable)
+        if niveau > self.niveaux [faux] and niveau > self.niveaux [vrai]:
+            return self.noeud (niveau, faux, vrai)
+        return self.ite (self.noeud (niveau, FAUX, VRAI), vrai, faux)
+
+    def compacter (self):
+        """
+        Libère la table unique et la place réservée en trop par les tableaux.
+        A appeler sur un diagramme terminé : la table est reconstruite au prochain appel à noeud().
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.table = None
+        self.niveaux = array ("i", self.niveaux)
+        self.faux = array ("i", self.faux)
+        self.vrai = array ("i", self.vrai)
+
+    def etiquette (self, noeud):
+        """
+        Retourne l'étiquette d'un noeud, au format des abd ("x3", "True", "False")
+
+        Parameters
+        ----------
+        noeud : int
+            L'indice du noeud.
+
+        Returns
+        -------
+        string
+            L'étiquette du noeud.
+
+        """
+
+        if noeud == FAUX:
+            return "False"
+        if noeud == VRAI:
+            return "True"
+        return "x" + str (self.variable (self.niveaux [noeud]))
+
+    def nb_noeuds (self, racine):
+        """
+        Retourne le nombre de noeuds accessibles depuis une racine (feuilles comprises), en un
+        parcours proportionnel à la taille du ROBDD et non à celle du gestionnaire (qui peut en
+        contenir beaucoup d'autres)
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine.
+
+        Returns
+        -------
+        int
+            Le nombre de noeuds.
+
+        """
+
+        vus = {racine}
+        pile = [racine]
+        faux = self.faux
+        vrai = self.vrai
+        while pile:
+            noeud = pile.pop ()
+            if noeud < 2:
+                continue
+            for fils in (faux [noeud], vrai [noeud]):
+                if fils not in vus:
+                    vus.add (fils)
+                    pile.append (fils)
+        return len (vus)
+
+    def niveaux_support (self, racine):
+        """
+        Retourne les niveaux des variables dont dépend un ROBDD (ceux de ses noeuds internes)
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine.
+
+        Returns
+        -------
+        list of int
+            Les niveaux, dans l'ordre croissant.
+
+        """
+
+        vus = {racine}
+        pile = [racine]
+        niveaux = set ()
+        faux = self.faux
+        vrai = self.vrai
+        while pile:
+            noeud = pile.pop ()
+            if noeud < 2:
+                continue
+            niveaux.add (self.niveaux [noeud])
+            for fils in (faux [noeud], vrai [noeud]):
+                if fils not in vus:
+                    vus.add (fils)
+                    pile.append (fils)
+        return sorted (niveaux)
+
+    def importer (self, autre, racine):
+        """
+        Recopie dans le gestionnaire un diagramme rangé dans un autre gestionnaire
+        (les deux ordres des variables peuvent être différents, cf. construire())
+
+        Parameters
+        ----------
+        autre : gestionnaire
+            Le gestionnaire qui contient le diagramme.
+        racine : int
+            L'indice de la racine du diagramme dans autre.
+
+        Returns
+        -------
+        int
+            L'indice de la racine de la copie.
+
+        """
+
+        if autre is self:
+            return racine
+        copies = {FAUX: FAUX, VRAI: VRAI}
+        pile = [racine]
+        while pile:
+            noeud = pile [-1]
+            if noeud in copies:
+                pile.pop ()
+                continue
+            faux = copies.get (autre.faux [noeud])
+            vrai = copies.get (autre.vrai [noeud])
+            if faux is None or vrai is None:
+                if faux is None:
+                    pile.append (autre.faux [noeud])
+                if vrai is None:
+                    pile.append (autre.vrai [noeud])
+                continue
+            copies [noeud] = self.construire (autre.variable (autre.niveaux [noeud]), faux, vrai)
+            pile.pop ()
+        return copies [racine]
+
+    def appliquer (self, op, u, v):
+        """
+        Combine deux ROBDD du gestionnaire par un opérateur binaire (algorithme Apply de Bryant).
+        Les résultats intermédiaires sont mémorisés dans la table de calcul self.cache, indexée
+        par (op, u, v) : chaque couple de noeuds n'est traité qu'une fois.
+
+        Parameters
+        ----------
+        op : string, int ou fonction
+            L'opérateur (cf. code_operateur()).
+        u : int
+            L'indice du 1er ROBDD.
+        v : int
+            L'indice du 2ème ROBDD.
+
+        Returns
+        -------
+        int
+            L'indice du ROBDD résultat.
+
+        """
+
+        op = code_operateur (op)
+        cache = self.cache
+        niveaux = self.niveaux
+        faux = self.faux
+        vrai = self.vrai
+        pile = [(u, v)]
+        while pile:
+            a, b = pile [-1]
+            if (op, a, b) in cache:
+                pile.pop ()
+                continue
+            if a < 2 and b < 2:
+                cache [(op, a, b)] = (op >> (2 * a + b)) & 1
+                pile.pop ()
+                continue
+            variable = max (niveaux [a], niveaux [b])
+            if niveaux [a] == variable:
+                a0, a1 = faux [a], vrai [a]
+            else:
+                a0 = a1 = a
+            if niveaux [b] == variable:
+                b0, b1 = faux [b], vrai [b]
+            else:
+                b0 = b1 = b
+            r0 = cache.get ((op, a0, b0))
+            r1 = cache.get ((op, a1, b1))
+            if r0 is None or r1 is None:
+                if r0 is None:
+                    pile.append ((a0, b0))
+                if r1 is None:
+                    pile.append ((a1, b1))
+                continue
+            cache [(op, a, b)] = self.noeud (variable, r0, r1)
+            pile.pop ()
+        return cache [(op, u, v)]
+
+    def ite (self, f, g, h):
+        """
+        Retourne le ROBDD de "si f alors g sinon h" (opérateur ITE), avec une pile explicite.
+        Les résultats intermédiaires sont mémorisés dans self.cache, indexée par ("ite", f, g, h).
+
+        Parameters
+        ----------
+        f : int
+            L'indice du ROBDD de la condition.
+        g : int
+            L'indice du ROBDD du cas vrai.
+        h : int
+            L'indice du ROBDD du cas faux.
+
+        Returns
+        -------
+        int
+            L'indice du ROBDD résultat.
+
+        """
+
+        cache = self.cache
+        niveaux = self.niveaux
+        faux = self.faux
+        vrai = self.vrai
+        def immediat (f, g, h):
+            if f == VRAI or g == h:
+                return g
+            if f == FAUX:
+                return h
+            if g == VRAI and h == FAUX:
+                return f
+            return cache.get (("ite", f, g, h))
+        pile = [(f, g, h)]
+        while pile:
+            a, b, c = pile [-1]
+            if immediat (a, b, c) is not None:
+                pile.pop ()
+                continue
+            variable = max (niveaux [a], niveaux [b], niveaux [c])
+            cofacteurs = []
+            for x in (a, b, c):
+                if niveaux [x] == variable:
+                    cofacteurs.append ((faux [x], vrai [x]))
+                else:
+                    cofacteurs.append ((x, x))
+            (a0, a1), (b0, b1), (c0, c1) = cofacteurs
+            r0 = immediat (a0, b0, c0)
+            r1 = immediat (a1, b1, c1)
+            if r0 is None or r1 is None:
+                if r0 is None:
+                    pile.append ((a0, b0, c0))
+                if r1 is None:
+                    pile.append ((a1, b1, c1))
+                continue
+            cache [("ite", a, b, c)] = self.noeud (variable, r0, r1)
+            pile.pop ()
+        return immediat (f, g, h)
+
+    def transformer (self, racine, direct, combiner):
+        """
+        Parcours postfixe générique d'un ROBDD du gestionnaire, avec une pile explicite :
+        le résultat de chaque noeud est calculé une seule fois (mémorisé pour cet appel).
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+        direct : fonction
+            Prend un noeud et retourne son résultat s'il ne dépend pas de ses fils, None sinon.
+        combiner : fonction
+            Prend un noeud et les résultats de ses fils faux et vrai, et retourne son résultat.
+
+        Returns
+        -------
+        int
+            Le résultat de la racine.
+
+        """
+
+        faux = self.faux
+        vrai = self.vrai
+        resultats = dict()
+        pile = [racine]
+        while pile:
+            noeud = pile [-1]
+            if noeud in resultats:
+                pile.pop ()
+                continue
+            res = direct (noeud)
+            if res is not None:
+                resultats [noeud] = res
+                pile.pop ()
+                continue
+            r0 = resultats.get (faux [noeud])
+            r1 = resultats.get (vrai [noeud])
+            if r0 is None or r1 is None:
+                if r0 is None:
+                    pile.append (faux [noeud])
+                if r1 is None:
+                    pile.append (vrai [noeud])
+                continue
+            resultats [noeud] = combiner (noeud, r0, r1)
+            pile.pop ()
+        return resultats [racine]
+
+    def restreindre (self, racine, variable, valeur):
+        """
+        Retourne le cofacteur d'un ROBDD : la fonction obtenue en fixant la valeur d'une variable
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+        variable : int
+            Le numéro i de la variable x_i à fixer.
+        valeur : bool
+            La valeur de x_i.
+
+        Returns
+        -------
+        int
+            L'indice du ROBDD résultat.
+
+        """
+
+        niveaux = self.niveaux
+        niveau = self.niveau (variable)
+        fils = self.vrai if valeur else self.faux
+        def direct (noeud):
+            if niveaux [noeud] < niveau:
+                return noeud
+            if niveaux [noeud] == niveau:
+                return fils [noeud]
+            return None
+        def combiner (noeud, r0, r1):
+            return self.noeud (niveaux [noeud], r0, r1)
+        return self.transformer (racine, direct, combiner)
+
+    def quantifier (self, racine, variables_quantifiees, op):
+        """
+        Elimine des variables d'un ROBDD en combinant, pour chacune, ses deux cofacteurs
+        par un opérateur ("ou" pour la quantification existentielle, "et" pour l'universelle)
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+        variables_quantifiees : iterable of int
+            Les numéros des variables à éliminer.
+        op : string ou int
+            L'opérateur qui combine les cofacteurs (cf. code_operateur()).
+
+        Returns
+        -------
+        int
+            L'indice du ROBDD résultat.
+
+        """
+
+        quantifiees = {self.niveau (variable) for variable in variables_quantifiees}
+        if not quantifiees:
+            return racine
+        plus_basse = min (quantifiees)
+        niveaux = self.niveaux
+        op = code_operateur (op)
+        def direct (noeud):
+            if niveaux [noeud] < plus_basse:
+                return noeud
+            return None
+        def combiner (noeud, r0, r1):
+            if niveaux [noeud] in quantifiees:
+                return self.appliquer (op, r0, r1)
+            return self.noeud (niveaux [noeud], r0, r1)
+        return self.transformer (racine, direct, combiner)
+
+    def composer (self, racine, substitutions):
+        """
+        Substitue simultanément des ROBDD à des variables d'un ROBDD (composition fonctionnelle) :
+        chaque noeud x_i est remplacé par ite (g_i, fils vrai, fils faux), où g_i est le ROBDD
+        substitué à x_i, ou x_i lui-même si elle n'est pas substituée.
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+        substitutions : dict
+            Associe au numéro de chaque variable substituée l'indice du ROBDD qui la remplace.
+
+        Returns
+        -------
+        int
+            L'indice du ROBDD résultat.
+
+        """
+
+        if not substitutions:
+            return racine
+        substitutions = {self.niveau (variable): g for variable, g in substitutions.items ()}
+        plus_basse = min (substitutions)
+        niveaux = self.niveaux
+        def direct (noeud):
+            if niveaux [noeud] < plus_basse:
+                return noeud
+            return None
+        def combiner (noeud, r0, r1):
+            niveau = niveaux [noeud]
+            g = substitutions.get (niveau)
+            if g is None:
+                g = self.noeud (niveau, FAUX, VRAI)
+            return self.ite (g, r1, r0)
+        return self.transformer (racine, direct, combiner)
+
+    def nb_solutions (self, racine, nb_variables):
+        """
+        Compte les affectations de x_1, ..., x_nb_variables qui satisfont un ROBDD, en un parcours
+        postfixe : une variable du support sautée entre un noeud et son fils double le nombre de
+        solutions, et chaque variable hors du support le double aussi. Les niveaux sont comptés
+        parmi ceux du support (cf. niveaux_support()), pour que le résultat ne dépende ni de l'ordre
+        des variables ni des autres variables du gestionnaire.
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+        nb_variables : int
+            Le nombre de variables de la fonction (au moins le plus grand numéro de variable dont
+            dépend le ROBDD).
+
+        Returns
+        -------
+        int
+            Le nombre de solutions (entier exact).
+
+        """
+
+        niveaux = self.niveaux
+        support = self.niveaux_support (racine)
+        # Le rang d'un niveau parmi ceux du support (0 pour les feuilles)
+        rangs = {niveau: rang for rang, niveau in enumerate (support, 1)}
+        rangs [0] = 0
+        def direct (noeud):
+            if noeud < 2:
+                return noeud
+            return None
+        def combiner (noeud, r0, r1):
+            rang = rangs [niveaux [noeud]] - 1
+            return ((r0 << (rang - rangs [niveaux [self.faux [noeud]]]))
+                    + (r1 << (rang - rangs [niveaux [self.vrai [noeud]]])))
+        return self.transformer (racine, direct, combiner) << (nb_variables - rangs [niveaux [racine]])
+
+    def solutions (self, racine, nb_variables=None):
+        """
+        Enumère une à une les solutions d'un ROBDD, par un parcours en profondeur des chemins
+        qui mènent à la feuille True (aucun chemin n'est construit d'avance)
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+        nb_variables : int, optional
+            Si précisé, les affectations complètes de x_1, ..., x_nb_variables sont énumérées.
+            None par défaut (un cube par chemin : seules les variables du chemin sont fixées).
+
+        Yields
+        ------
+        dict
+            Associe au numéro de chaque variable fixée sa valeur (bool).
+
+        """
+
+        niveaux = self.niveaux
+        faux = self.faux
+        vrai = self.vrai
+        pile = [(racine, ())]
+        while pile:
+            noeud, cube = pile.pop ()
+            if noeud == FAUX:
+                continue
+            if noeud == VRAI:
+                if nb_variables is None:
+                    yield dict (cube)
+                    continue
+                fixees = dict (cube)
+                libres = [i for i in range (1, nb_variables + 1) if i not in fixees]
+                for valeurs in range (1 << len (libres)):
+                    affectation = dict (fixees)
+                    for j, i in enumerate (libres):
+                        affectation [i] = bool ((valeurs >> j) & 1)
+                    yield affectation
+                continue
+            variable = self.variable (niveaux [noeud])
+            pile.append ((vrai [noeud], cube + ((variable, True),)))
+            pile.append ((faux [noeud], cube + ((variable, False),)))
+
+    def table_entiere (self, racine):
+        """
+        Retourne la table de vérité d'un ROBDD sur les variables x_1 à x_k (k la variable de la racine
+        dans l'ordre naturel, cf. naturel()), codée en entier comme pour table() : le bit j donne
+        la valeur pour x_i = bit i - 1 de j.
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+
+        Returns
+        -------
+        int
+            La table de vérité.
+
+        """
+
+        g, racine = self.naturel (racine)
+        niveaux = g.niveaux
+        def etendre (table, debut, fin):
+            # Passe d'une table sur x_1..x_debut à une table sur x_1..x_fin (recopies)
+            for i in range (debut, fin):
+                table |= table << (1 << i)
+            return table
+        def direct (noeud):
+            if noeud < 2:
+                return noeud
+            return None
+        def combiner (noeud, r0, r1):
+            variable = niveaux [noeud] - 1
+            r0 = etendre (r0, niveaux [g.faux [noeud]], variable)
+            r1 = etendre (r1, niveaux [g.vrai [noeud]], variable)
+            return r0 | (r1 << (1 << variable))
+        return g.transformer (racine, direct, combiner)
+
+    def code_python (self, racine):
+        """
+        Génère le code source Python d'une fonction qui évalue un ROBDD.
+        La partie en arbre du ROBDD (noeuds à un seul père, jusqu'à PROFONDEUR_MAX_CODE niveaux)
+        devient des if x [i - 1]: imbriqués ; le reste, à partir des noeuds partagés, est parcouru
+        par une boucle sur une table des noeuds, sans appel récursif (la profondeur d'un ROBDD
+        n'est donc pas limitée par la pile d'appels).
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+
+        Returns
+        -------
+        string
+            Le code source, qui définit la fonction n<racine> (x), où x [i - 1] est la valeur de x_i.
+
+        """
+
+        niveaux = self.niveaux
+        faux = self.faux
+        vrai = self.vrai
+        peres = dict ()
+        pile = [racine]
+        vus = {racine}
+        while pile:
+            noeud = pile.pop ()
+            if noeud < 2:
+                continue
+            for fils in (faux [noeud], vrai [noeud]):
+                peres [fils] = peres.get (fils, 0) + 1
+                if fils not in vus:
+                    vus.add (fils)
+                    pile.append (fils)
+
+        lignes = ["def n%d (x):" % racine]
+        parcourus = []
+        pile = [(racine, 1)]
+        while pile:
+            noeud, profondeur = pile.pop ()
+            marge = "    " * profondeur
+            if noeud < 2:
+                lignes.append (marge + ("return True" if noeud == VRAI else "return False"))
+            elif noeud != racine and (peres [noeud] > 1 or profondeur > PROFONDEUR_MAX_CODE):
+                lignes.append (marge + "return parcours_%d (x, %d)" % (racine, noeud))
+                parcourus.append (noeud)
+            else:
+                lignes.append (marge + "if x [%d]:" % (self.variable (niveaux [noeud]) - 1))
+                pile.append ((faux [noeud], profondeur))
+                pile.append ((vrai [noeud], profondeur + 1))
+        lignes.append ("")
+        if not parcourus:
+            return "\n".join (lignes)
+
+        # La table des noeuds accessibles depuis ceux laissés à la boucle : indice -> (i, faux, vrai)
+        table = dict ()
+        pile = parcourus
+        while pile:
+            noeud = pile.pop ()
+            if noeud < 2 or noeud in table:
+                continue
+            table [noeud] = (self.variable (niveaux [noeud]) - 1, faux [noeud], vrai [noeud])
+            pile.append (faux [noeud])
+            pile.append (vrai [noeud])
+        lignes.append ("NOEUDS_%d = {" % racine)
+        lignes.extend ("    %d: (%d, %d, %d)," % ((noeud,) + entree) for noeud, entree in sorted (table.items ()))
+        lignes.append ("}")
+        lignes.append ("")
+        lignes.append ("def parcours_%d (x, n):" % racine)
+        lignes.append ("    while n > 1:")
+        lignes.append ("        i, faux, vrai = NOEUDS_%d [n]" % racine)
+        lignes.append ("        n = vrai if x [i] else faux")
+        lignes.append ("    return n == %d" % VRAI)
+        lignes.append ("")
+        return "\n".join (lignes)
+
+    def compiler (self, racine, entier=False):
+        """
+        Compile un ROBDD en une fonction Python (cf. code_python()), mémorisée dans self.cache :
+        un ROBDD n'est compilé qu'une fois.
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+        entier : bool, optional
+            Si True, la fonction lit le résultat dans la table de vérité codée en entier
+            (cf. table_entiere()), en un seul test de bit : à réserver aux fonctions de peu de variables.
+            False par défaut.
+
+        Returns
+        -------
+        fonction
+            Prend une séquence x (x [i - 1] la valeur de x_i) et retourne la valeur du ROBDD (bool).
+            Son code source est dans son attribut source.
+
+        """
+
+        cle = ("compiler", racine, entier)
+        fonction = self.cache.get (cle)
+        if fonction is not None:
+            return fonction
+        if entier:
+            g, r = self.naturel (racine)
+            nb_variables = g.niveaux [r]
+            indice = " | ".join (["int (x [0])"] + ["int (x [%d]) << %d" % (i, i) for i in range (1, nb_variables)])
+            source = "def n%d (x):\n    return (TABLE >> (%s)) & 1 == 1\n" % (racine, indice if nb_variables else "0")
+            espace = {"TABLE": self.table_entiere (racine)}
+        else:
+            source = self.code_python (racine)
+            espace = dict ()
+        exec (compile (source, "<robdd %d>" % racine, "exec"), espace)
+        fonction = espace ["n%d" % racine]
+        fonction.source = source
+        self.cache [cle] = fonction
+        return fonction
+
+    def ajouter_racine (self, racine):
+        """
+        Enregistre une référence vers un noeud (cf. vue_abd), qui sera conservé par tamiser()
+
+        Parameters
+        ----------
+        racine : int
+            L'indice du noeud.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.racines [racine] = self.racines.get (racine, 0) + 1
+
+    def retirer_racine (self, racine):
+        """
+        Supprime une référence enregistrée par ajouter_racine()
+
+        Parameters
+        ----------
+        racine : int
+            L'indice du noeud.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        nb = self.racines.get (racine, 0) - 1
+        if nb > 0:
+            self.racines [racine] = nb
+        else:
+            self.racines.pop (racine, None)
+
+    def collecter (self, racines=None):
+        """
+        Ramasse-miettes : marque les noeuds accessibles depuis les racines et libère tous les autres
+        (cf. self.libres), retire de la table de calcul les entrées qui mentionnent un noeud libéré,
+        rend la place des noeuds libérés en fin de tableaux et réduit la table unique.
+        Les indices des noeuds conservés ne changent pas (les vues restent valables).
+        A n'appeler qu'entre deux opérations : l'indice d'un noeud libéré est réutilisé par noeud().
+
+        Parameters
+        ----------
+        racines : iterable of int, optional
+            Les indices des ROBDD à conserver. None par défaut (les noeuds des vue_abd existantes,
+            cf. self.racines).
+
+        Returns
+        -------
+        int
+            Le nombre de noeuds libérés.
+
+        """
+
+        if self.lecture_seule:
+            raise ValueError ("Impossible de libérer les noeuds d'un gestionnaire en lecture seule")
+        if racines is None:
+            racines = list (self.racines)
+        niveaux = self.niveaux
+        faux = self.faux
+        vrai = self.vrai
+        vus = bytearray (len (niveaux))
+        vus [FAUX] = vus [VRAI] = 1
+        pile = []
+        for racine in racines:
+            if not vus [racine]:
+                vus [racine] = 1
+                pile.append (racine)
+        while pile:
+            noeud = pile.pop ()
+            for fils in (faux [noeud], vrai [noeud]):
+                if not vus [fils]:
+                    vus [fils] = 1
+                    pile.append (fils)
+        nb_liberes = 0
+        for noeud in range (2, len (niveaux)):
+            if not vus [noeud] and faux [noeud] != vrai [noeud]:
+                niveaux [noeud] = faux [noeud] = vrai [noeud] = FAUX
+                self.libres.append (noeud)
+                nb_liberes += 1
+        fin = len (niveaux)
+        while fin > 2 and not vus [fin - 1]:
+            fin -= 1
+        if fin < len (niveaux):
+            del niveaux [fin:]
+            del faux [fin:]
+            del vrai [fin:]
+            self.libres = [noeud for noeud in self.libres if noeud < fin]
+        # noeud() réutilise d'abord les plus petits indices, pour que la fin des tableaux se libère
+        self.libres.sort (reverse=True)
+
+        # Les positions des noeuds dans les clés de la table de calcul, selon leur sorte : (op, a, b)
+        # pour appliquer(), ("ite", f, g, h), ("compiler", racine, entier) et ("table", largeur, bits)
+        # pour abd.cons_robdd(), dont seule la valeur est un noeud
+        positions = {"ite": (1, 2, 3), "compiler": (1,), "table": ()}
+
+        def vivant (valeur):
+            return not isinstance (valeur, int) or valeur < fin and vus [valeur]
+
+        def entree_vivante (cle, valeur):
+            return vivant (valeur) and all (vivant (cle [i]) for i in positions.get (cle [0], (1, 2)))
+
+        self.cache = {cle: valeur for cle, valeur in self.cache.items () if entree_vivante (cle, valeur)}
+        if self.table is not None:
+            self.reconstruire_table (self.taille_table (reduire=True))
+        return nb_liberes
+
+    def preparer_reordonnancement (self, racines):
+        """
+        Prépare un changement d'ordre des variables : libère les noeuds inaccessibles depuis les
+        racines (cf. collecter()), compte les références de chaque noeud conservé, range ces noeuds
+        par niveau et vide la table de calcul
+
+        Parameters
+        ----------
+        racines : iterable of int
+            Les indices des ROBDD à conserver.
+
+        Returns
+        -------
+        references : list of int
+            Le nombre de pères (et de références de racine) de chaque noeud.
+        par_niveau : list of set
+            Les noeuds vivants de chaque niveau (aucun pour le niveau 0 des feuilles).
+
+        """
+
+        racines = list (racines)
+        self.collecter (racines)
+        niveaux = self.niveaux
+        faux = self.faux
+        vrai = self.vrai
+        references = [0] * len (niveaux)
+        vus = bytearray (len (niveaux))
+        vus [FAUX] = vus [VRAI] = 1
+        pile = []
+        for racine in racines:
+            references [racine] += 1
+            if not vus [racine]:
+                vus [racine] = 1
+                pile.append (racine)
+        par_niveau = [set () for _ in range (max ((niveaux [racine] for racine in pile), default=0) + 1)]
+        while pile:
+            noeud = pile.pop ()
+            par_niveau [niveaux [noeud]].add (noeud)
+            for fils in (faux [noeud], vrai [noeud]):
+                references [fils] += 1
+                if not vus [fils]:
+                    vus [fils] = 1
+                    pile.append (fils)
+        while len (self.ordre) < len (par_niveau):
+            self.ordre.append (len (self.ordre))
+            self.positions.append (len (self.positions))
+        self.cache.clear ()
+        return references, par_niveau
+
+    def echanger (self, niveau, references, par_niveau):
+        """
+        Echange les variables des niveaux niveau et niveau + 1, sur place : chaque noeud garde son
+        indice et sa fonction (les vues restent valables). Un noeud x (du haut) dont un fils
+        porte la variable y (du bas) devient le noeud y de fils x (f00, f10) et x (f01, f11),
+        où fij est le cofacteur de son fils i pour y = j ; les noeuds qui ne sont plus
+        référencés sont libérés.
+
+        Parameters
+        ----------
+        niveau : int
+            Le niveau du bas (au moins 1).
+        references : list of int
+            Les références des noeuds (cf. preparer_reordonnancement()), mises à jour.
+        par_niveau : list of set
+            Les noeuds vivants de chaque niveau, mis à jour.
+
+        Returns
+        -------
+        int
+            La variation du nombre de noeuds vivants.
+
+        """
+
+        niveaux = self.niveaux
+        faux = self.faux
+        vrai = self.vrai
+        while len (par_niveau) <= niveau + 1:
+            par_niveau.append (set ())
+        while len (self.ordre) <= niveau + 1:
+            self.ordre.append (len (self.ordre))
+            self.positions.append (len (self.positions))
+        haut = par_niveau [niveau + 1]
+        bas = par_niveau [niveau]
+        a_reecrire = [(noeud, faux [noeud], vrai [noeud]) for noeud in haut
+                      if niveaux [faux [noeud]] == niveau or niveaux [vrai [noeud]] == niveau]
+        for noeud in haut:
+            self.retirer (noeud)
+        for noeud in bas:
+            self.retirer (noeud)
+        # Les noeuds à réécrire sont marqués libres le temps de l'échange, pour qu'une reconstruction
+        # de la table pendant l'échange les ignore
+        for noeud, _, _ in a_reecrire:
+            faux [noeud] = vrai [noeud] = FAUX
+
+        variable_haut = self.ordre [niveau + 1]
+        variable_bas = self.ordre [niveau]
+        self.ordre [niveau] = variable_haut
+        self.ordre [niveau + 1] = variable_bas
+        self.positions [variable_haut] = niveau
+        self.positions [variable_bas] = niveau + 1
+
+        nouv_haut = set (bas)
+        nouv_bas = haut.difference (noeud for noeud, _, _ in a_reecrire)
+        for noeud in nouv_haut:
+            niveaux [noeud] = niveau + 1
+        for noeud in nouv_bas:
+            niveaux [noeud] = niveau
+        for noeud in nouv_haut:
+            self.inserer (noeud)
+        for noeud in nouv_bas:
+            self.inserer (noeud)
+        par_niveau [niveau] = nouv_bas
+        par_niveau [niveau + 1] = nouv_haut
+
+        variation = 0
+        def noeud_vivant (f0, f1):
+            nonlocal variation
+            if f0 == f1:
+                references [f0] += 1
+                return f0
+            res = self.noeud (niveau, f0, f1)
+            if res not in nouv_bas:
+                # Noeud créé (dans une case libre ou à la fin des tableaux)
+                if res < len (references):
+                    references [res] = 0
+                else:
+                    references.append (0)
+                nouv_bas.add (res)
+                references [f0] += 1
+                references [f1] += 1
+                variation += 1
+            references [res] += 1
+            return res
+
+        anciens_fils = []
+        for noeud, f0, f1 in a_reecrire:
+            if f0 in bas:
+                f00, f01 = faux [f0], vrai [f0]
+            else:
+                f00 = f01 = f0
+            if f1 in bas:
+                f10, f11 = faux [f1], vrai [f1]
+            else:
+                f10 = f11 = f1
+            nouv_faux = noeud_vivant (f00, f10)
+            nouv_vrai = noeud_vivant (f01, f11)
+            niveaux [noeud] = niveau + 1
+            faux [noeud] = nouv_faux
+            vrai [noeud] = nouv_vrai
+            self.inserer (noeud)
+            nouv_haut.add (noeud)
+            anciens_fils.append (f0)
+            anciens_fils.append (f1)
+
+        pile = anciens_fils
+        while pile:
+            noeud = pile.pop ()
+            references [noeud] -= 1
+            if references [noeud] or noeud < 2:
+                continue
+            self.retirer (noeud)
+            par_niveau [niveaux [noeud]].discard (noeud)
+            pile.append (faux [noeud])
+            pile.append (vrai [noeud])
+            niveaux [noeud] = faux [noeud] = vrai [noeud] = FAUX
+            self.libres.append (noeud)
+            variation -= 1
+        return variation
+
+    def tamiser (self, racines=None, croissance_max=1.2):
+        """
+        Réduit la taille des ROBDD en changeant l'ordre des variables (tamisage de Rudell) :
+        chaque variable, de la plus représentée à la moins représentée, est descendue puis remontée
+        (en commençant par l'extrémité la plus proche) par échanges de niveaux adjacents, et
+        laissée au niveau qui donne le moins de noeuds. Un déplacement s'arrête dès que la taille
+        dépasse croissance_max fois la meilleure taille vue.
+        Les noeuds qui ne sont pas accessibles depuis les racines sont libérés et la table de calcul
+        est vidée ; les indices des noeuds conservés ne changent pas.
+        Les tailles avant et après le tamisage sont aussi gardées dans self.dernier_tamisage.
+
+        Parameters
+        ----------
+        racines : iterable of int, optional
+            Les indices des ROBDD à conserver. None par défaut (les noeuds des vue_abd existantes,
+            cf. self.racines).
+        croissance_max : float, optional
+            La croissance tolérée pendant un déplacement. 1.2 par défaut.
+
+        Returns
+        -------
+        taille_avant : int
+            Le nombre de noeuds accessibles depuis les racines (feuilles comprises) avant le tamisage.
+        taille_apres : int
+            Ce nombre après le tamisage.
+
+        """
+
+        if self.lecture_seule:
+            raise ValueError ("Impossible de réordonner un gestionnaire en lecture seule")
+        if racines is None:
+            racines = list (self.racines)
+        references, par_niveau = self.preparer_reordonnancement (racines)
+        taille_avant = 2 + sum (len (noeuds) for noeuds in par_niveau)
+        taille = taille_avant
+        nb_niveaux = len (par_niveau) - 1
+        variables = sorted (self.ordre [1:nb_niveaux + 1], key=lambda variable: -len (par_niveau [self.positions [variable]]))
+        for variable in variables:
+            position = self.positions [variable]
+            meilleure_taille = taille
+            meilleure_position = position
+            if position - 1 < nb_niveaux - position:
+                sens = (-1, 1)
+            else:
+                sens = (1, -1)
+            for pas in sens:
+                while 1 <= position + pas <= nb_niveaux:
+                    taille += self.echanger (min (position, position + pas), references, par_niveau)
+                    position += pas
+                    if taille < meilleure_taille:
+                        meilleure_taille = taille
+                        meilleure_position = position
+                    elif taille > croissance_max * meilleure_taille:
+                        break
+            while position != meilleure_position:
+                pas = 1 if meilleure_position > position else -1
+                taille += self.echanger (min (position, position + pas), references, par_niveau)
+                position += pas
+        self.reconstruire_table (self.taille_table ())
+        self.dernier_tamisage = (taille_avant, taille)
+        return taille_avant, taille
+
+    def verifier_taille (self):
+        """
+        Ramasse-miettes et tamisage automatiques : si self.seuil_collecte (resp. self.seuil_tamisage)
+        est fixé et que le nombre de noeuds du gestionnaire le dépasse, appelle collecter()
+        (resp. tamiser()) et double le seuil s'il reste trop bas.
+        Les abd qui appellent verifier_taille() ignorent son résultat : les tailles du dernier
+        tamisage automatique restent lisibles dans self.dernier_tamisage.
+        A n'appeler qu'entre deux opérations : seuls les noeuds des vue_abd sont conservés.
+
+        Returns
+        -------
+        (int, int) or None
+            Les tailles avant et après le tamisage, None s'il n'a pas eu lieu.
+
+        """
+
+        if self.lecture_seule:
+            return None
+        if self.seuil_collecte is not None and len (self.niveaux) - len (self.libres) > self.seuil_collecte:
+            self.collecter ()
+            self.seuil_collecte = max (self.seuil_collecte, 2 * (len (self.niveaux) - len (self.libres)))
+        if self.seuil_tamisage is None:
+            return None
+        if len (self.niveaux) - len (self.libres) <= self.seuil_tamisage:
+            return None
+        tailles = self.tamiser ()
+        self.seuil_tamisage = max (self.seuil_tamisage, 2 * tailles [1])
+        return tailles
+
+    def sauvegarder (self, racine, fichier):
+        """
+        Sauvegarde dans un fichier binaire (cf. SIGNATURE) le ROBDD accessible depuis une racine.
+        Les noeuds sont renumérotés dans l'ordre d'un parcours postfixe (les feuilles gardent
+        les indices 0 et 1), si bien que les fils de chaque noeud sont écrits avant lui.
+
+        Parameters
+        ----------
+        racine : int
+            L'indice de la racine du ROBDD.
+        fichier : string
+            Nom du fichier.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        niveaux = self.niveaux
+        faux = self.faux
+        vrai = self.vrai
+        numeros = {FAUX: FAUX, VRAI: VRAI}
+        enregistrements = array ("i", [0, FAUX, FAUX, 0, VRAI, VRAI])
+        pile = [racine]
+        while pile:
+            noeud = pile [-1]
+            if noeud in numeros:
+                pile.pop ()
+                continue
+            nouv_faux = numeros.get (faux [noeud])
+            nouv_vrai = numeros.get (vrai [noeud])
+            if nouv_faux is None or nouv_vrai is None:
+                if nouv_faux is None:
+                    pile.append (faux [noeud])
+                if nouv_vrai is None:
+                    pile.append (vrai [noeud])
+                continue
+            numeros [noeud] = len (numeros)
+            enregistrements.extend ((niveaux [noeud], nouv_faux, nouv_vrai))
+            pile.pop ()
+        nb_niveaux = max (max (enregistrements [0::3]), len (self.ordre) - 1)
+        ordre = array ("i", (self.variable (niveau) for niveau in range (nb_niveaux + 1)))
+        if sys.byteorder != "little":
+            ordre.byteswap ()
+            enregistrements.byteswap ()
+        with open (fichier, "wb") as f:
+            f.write (ENTETE.pack (SIGNATURE, VERSION, nb_niveaux, len (numeros), numeros [racine]))
+            ordre.tofile (f)
+            enregistrements.tofile (f)
+
+    @staticmethod
+    def charger (fichier):
+        """
+        Ouvre un ROBDD sauvegardé par sauvegarder(), sans lire ses noeuds un à un : le fichier
+        est projeté en mémoire (mmap) et les tableaux du gestionnaire sont des memoryview sur
+        ses enregistrements. Le gestionnaire obtenu est en lecture seule.
+
+        Parameters
+        ----------
+        fichier : string
+            Nom du fichier.
+
+        Returns
+        -------
+        gestionnaire
+            Le gestionnaire (en lecture seule) qui contient le ROBDD.
+        int
+            L'indice de la racine du ROBDD.
+
+        """
+
+        with open (fichier, "rb") as f:
+            projection = mmap.mmap (f.fileno (), 0, access=mmap.ACCESS_READ)
+        if len (projection) < ENTETE.size:
+            raise ValueError ("Le fichier " + fichier + " n'est pas un ROBDD sauvegardé")
+        signature, version, nb_niveaux, nb_noeuds, racine = ENTETE.unpack_from (projection)
+        if signature != SIGNATURE:
+            raise ValueError ("Le fichier " + fichier + " n'est pas un ROBDD sauvegardé")
+        if version not in (1, VERSION):
+            raise ValueError ("Version " + str (version) + " du format non prise en charge (" + fichier + ")")
+        debut = ENTETE.size
+        if version == VERSION:
+            debut += 4 * (nb_niveaux + 1)
+        fin = debut + 12 * nb_noeuds
+        if len (projection) < fin:
+            raise ValueError ("Le fichier " + fichier + " est tronqué")
+
+        if sys.byteorder == "little":
+            enregistrements = memoryview (projection) [debut:fin].cast ("i")
+        else:
+            enregistrements = array ("i", projection [debut:fin])
+            enregistrements.byteswap ()
+        g = gestionnaire (taille_table=1)
+        if version == VERSION:
+            g.ordre = array ("i", projection [ENTETE.size:debut])
+            if sys.byteorder != "little":
+                g.ordre.byteswap ()
+            g.positions = array ("i", bytes (4 * (nb_niveaux + 1)))
+            for niveau, variable in enumerate (g.ordre):
+                g.positions [variable] = niveau
+        g.niveaux = enregistrements [0::3]
+        g.faux = enregistrements [1::3]
+        g.vrai = enregistrements [2::3]
+        g.table = None
+        g.lecture_seule = True
+        return g, racine
@@ -0,0 +1,407 @@
+from abd import abd
+from complement import gestionnaire_complement
+from gestionnaire import gestionnaire
+import contextlib
+import copy
+import time
+
+# Instrumentation des ROBDD : activer() remplace les méthodes mesurées par des versions qui
+# comptent et chronomètrent, desactiver() remet les originales. Désactivée, l'instrumentation
+# ne coûte donc rien (aucun test dans les boucles).
+
+COMPTEURS = [
+    "noeuds_alloues",         # noeuds créés par noeud()
+    "table_unique_succes",    # appels à noeud() qui ont trouvé le noeud existant
+    "table_unique_echecs",    # appels à noeud() qui ont dû le créer
+    "cache_succes",           # consultations de la table de calcul fructueuses (appliquer(), ite(),
+                              # sous-tables de abd.cons_robdd())
+    "cache_echecs",           # consultations infructueuses
+    "pic_noeuds_vivants",     # plus grand nombre de noeuds vivants d'un gestionnaire
+    "noeuds_liberes",         # noeuds libérés par collecter()
+    "noeuds_graphe_produit",  # taille des graphes produits par fusion_ROBDD(), avant réduction
+]
+
+# Les opérations chronométrées (temps inclusif : une opération appelée par une autre est
+# comptée dans les deux)
+OPERATIONS = {
+    gestionnaire: ["appliquer", "ite", "importer", "restreindre", "quantifier", "composer",
+                   "nb_solutions", "tamiser", "collecter", "compiler", "sauvegarder"],
+    gestionnaire_complement: ["ite", "appliquer", "cons_robdd", "importer", "exporter"],
+    abd: ["cons_arbre", "luka", "compression", "compression_bdd", "cons_robdd", "nb_noeuds",
+          "appliquer", "fusion_ROBDD", "simplification_et_reduction_ROBDD"],
+}
+
+compteurs = dict.fromkeys (COMPTEURS, 0)
+temps = dict()
+portees = dict()
+originaux = dict()
+
+
+class cache_compte:
+    def __init__ (self, cache):
+        """
+        Enveloppe d'une table de calcul qui compte les consultations fructueuses et infructueuses
+        (mise en place le temps d'un appel à appliquer(), ite() ou abd.cons_robdd())
+
+        Parameters
+        ----------
+        cache : dict
+            La table de calcul.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.cache = cache
+
+    def __contains__ (self, cle):
+        if cle in self.cache:
+            compteurs ["cache_succes"] += 1
+            return True
+        compteurs ["cache_echecs"] += 1
+        return False
+
+    def get (self, cle, defaut=None):
+        res = self.cache.get (cle)
+        if res is None:
+            compteurs ["cache_echecs"] += 1
+            return defaut
+        compteurs ["cache_succes"] += 1
+        return res
+
+    def __getitem__ (self, cle):
+        return self.cache [cle]
+
+    def __setitem__ (self, cle, valeur):
+        self.cache [cle] = valeur
+
+    def __len__ (self):
+        return len (self.cache)
+
+    def __getattr__ (self, nom):
+        return getattr (self.cache, nom)
+
+
+def est_actif ():
+    """
+    Indique si l'instrumentation est activée
+
+    Returns
+    -------
+    bool
+        True si activer() a été appelée (et pas desactiver() depuis).
+
+    """
+
+    return bool (originaux)
+
+def chronometrer (nom, fonction):
+    """
+    Enveloppe une opération pour cumuler son nombre d'appels et son temps d'exécution dans temps
+
+    Parameters
+    ----------
+    nom : string
+        Le nom de l'opération.
+    fonction : function
+        L'opération.
+
+    Returns
+    -------
+    function
+        L'opération chronométrée.
+
+    """
+
+    def enveloppe (*args, **kwargs):
+        debut = time.perf_counter ()
+        try:
+            return fonction (*args, **kwargs)
+        finally:
+            mesure = temps.setdefault (nom, {"appels": 0, "total": 0.0})
+            mesure ["appels"] += 1
+            mesure ["total"] += time.perf_counter () - debut
+    return enveloppe
+
+def compter_cache (fonction, gestionnaire_appel=None):
+    """
+    Enveloppe une fonction qui consulte la table de calcul d'un gestionnaire pour compter ses
+    consultations (cf. cache_compte)
+
+    Parameters
+    ----------
+    fonction : function
+        La fonction.
+    gestionnaire_appel : function, optional
+        Retourne, à partir des arguments positionnels et nommés d'un appel, le gestionnaire dont
+        la table est consultée (ou None). None par défaut (le premier argument : une méthode).
+
+    Returns
+    -------
+    function
+        La fonction instrumentée.
+
+    """
+
+    def enveloppe (*args, **kwargs):
+        g = args [0] if gestionnaire_appel is None else gestionnaire_appel (args, kwargs)
+        if g is None or isinstance (g.cache, cache_compte):
+            return fonction (*args, **kwargs)
+        cache = g.cache
+        compte = cache_compte (cache)
+        g.cache = compte
+        try:
+            return fonction (*args, **kwargs)
+        finally:
+            # collecter() a pu remplacer la table pendant l'appel : la nouvelle est gardée
+            if g.cache is compte:
+                g.cache = cache
+    return enveloppe
+
+def gestionnaire_cons_robdd (args, kwargs):
+    """
+    Retourne le gestionnaire d'un appel à abd.cons_robdd (table_verite, nb_feuilles, gest),
+    dont la table de calcul mémorise les sous-tables de 8 et 16 bits
+
+    Parameters
+    ----------
+    args : tuple
+        Les arguments positionnels.
+    kwargs : dict
+        Les arguments nommés.
+
+    Returns
+    -------
+    gestionnaire
+        Le gestionnaire, None s'il n'est pas précisé (un nouveau gestionnaire, sans mémoire).
+
+    """
+
+    return kwargs.get ("gest", args [2] if len (args) > 2 else None)
+
+def compter_noeuds (fonction):
+    """
+    Enveloppe la méthode noeud() d'un gestionnaire : un appel qui ajoute un noeud vivant est un
+    échec de la table unique (et une allocation), les autres un succès
+
+    Parameters
+    ----------
+    fonction : function
+        La méthode noeud().
+
+    Returns
+    -------
+    function
+        La méthode instrumentée.
+
+    """
+
+    def enveloppe (self, niveau, faux, vrai):
+        if faux == vrai:
+            return faux
+        libres = getattr (self, "libres", ())
+        vivants = len (self.niveaux) - len (libres)
+        res = fonction (self, niveau, faux, vrai)
+        if len (self.niveaux) - len (libres) == vivants:
+            compteurs ["table_unique_succes"] += 1
+        else:
+            compteurs ["table_unique_echecs"] += 1
+            compteurs ["noeuds_alloues"] += 1
+            if vivants + 1 > compteurs ["pic_noeuds_vivants"]:
+                compteurs ["pic_noeuds_vivants"] = vivants + 1
+        return res
+    return enveloppe
+
+def compter_liberes (fonction):
+    """
+    Enveloppe gestionnaire.collecter() pour cumuler le nombre de noeuds libérés
+
+    Parameters
+    ----------
+    fonction : function
+        La méthode collecter().
+
+    Returns
+    -------
+    function
+        La méthode instrumentée.
+
+    """
+
+    def enveloppe (*args, **kwargs):
+        res = fonction (*args, **kwargs)
+        compteurs ["noeuds_liberes"] += res
+        return res
+    return enveloppe
+
+def compter_produit (fonction):
+    """
+    Enveloppe abd.fusion_ROBDD() pour cumuler la taille des graphes produits
+
+    Parameters
+    ----------
+    fonction : function
+        La fonction fusion_ROBDD().
+
+    Returns
+    -------
+    function
+        La fonction instrumentée.
+
+    """
+
+    nb_noeuds = originaux [(abd, "nb_noeuds")].__func__
+    def enveloppe (*args, **kwargs):
+        res = fonction (*args, **kwargs)
+        compteurs ["noeuds_graphe_produit"] += nb_noeuds (res)
+        return res
+    return enveloppe
+
+def activer ():
+    """
+    Active l'instrumentation (sans effet si elle l'est déjà)
+
+    Returns
+    -------
+    None.
+
+    """
+
+    if originaux:
+        return
+    for classe, noms in OPERATIONS.items ():
+        for nom in noms:
+            originaux [(classe, nom)] = classe.__dict__ [nom]
+    for classe in (gestionnaire, gestionnaire_complement):
+        originaux [(classe, "noeud")] = classe.noeud
+        classe.noeud = compter_noeuds (originaux [(classe, "noeud")])
+        for nom in OPERATIONS [classe]:
+            fonction = originaux [(classe, nom)]
+            if nom in ("appliquer", "ite"):
+                fonction = compter_cache (fonction)
+            if nom == "collecter":
+                fonction = compter_liberes (fonction)
+            setattr (classe, nom, chronometrer (classe.__name__ + "." + nom, fonction))
+    for nom in OPERATIONS [abd]:
+        fonction = originaux [(abd, nom)].__func__
+        if nom == "fusion_ROBDD":
+            fonction = compter_produit (fonction)
+        if nom == "cons_robdd":
+            fonction = compter_cache (fonction, gestionnaire_cons_robdd)
+        setattr (abd, nom, staticmethod (chronometrer ("abd." + nom, fonction)))
+
+def desactiver ():
+    """
+    Désactive l'instrumentation : les méthodes d'origine sont remises (les mesures sont gardées)
+
+    Returns
+    -------
+    None.
+
+    """
+
+    for (classe, nom), fonction in originaux.items ():
+        setattr (classe, nom, fonction)
+    originaux.clear ()
+
+def stats ():
+    """
+    Retourne les mesures cumulées depuis le dernier appel à reinitialiser_stats()
+
+    Returns
+    -------
+    dict
+        "actif" (cf. est_actif()), "compteurs" (cf. COMPTEURS), "temps" (nombre d'appels et temps
+        total en secondes de chaque opération) et "portees" (les mêmes mesures pour chaque portée,
+        cf. portee(), avec leur durée et leur nombre d'exécutions).
+
+    """
+
+    return {
+        "actif": est_actif (),
+        "compteurs": dict (compteurs),
+        "temps": copy.deepcopy (temps),
+        "portees": copy.deepcopy (portees),
+    }
+
+def reinitialiser_stats ():
+    """
+    Remet toutes les mesures à zéro
+
+    Returns
+    -------
+    None.
+
+    """
+
+    for nom in compteurs:
+        compteurs [nom] = 0
+    temps.clear ()
+    portees.clear ()
+
+def portee (nom):
+    """
+    Gestionnaire de contexte qui cumule sous un nom les mesures prises pendant un bloc
+    (with statistiques.portee ("..."):) ; sans effet si l'instrumentation est désactivée.
+    Le pic de noeuds vivants d'une portée est celui atteint pendant ses exécutions.
+
+    Parameters
+    ----------
+    nom : string
+        Le nom de la portée (des exécutions de même nom sont cumulées).
+
+    Returns
+    -------
+    context manager
+        Le contexte.
+
+    """
+
+    if not est_actif ():
+        return contextlib.nullcontext ()
+    return mesurer_portee (nom)
+
+@contextlib.contextmanager
+def mesurer_portee (nom):
+    """
+    Mesure un bloc (cf. portee())
+
+    Parameters
+    ----------
+    nom : string
+        Le nom de la portée.
+
+    Yields
+    ------
+    None.
+
+    """
+
+    compteurs_avant = dict (compteurs)
+    temps_avant = copy.deepcopy (temps)
+    compteurs ["pic_noeuds_vivants"] = 0
+    debut = time.perf_counter ()
+    try:
+        yield
+    finally:
+        duree = time.perf_counter () - debut
+        pic = compteurs ["pic_noeuds_vivants"]
+        compteurs ["pic_noeuds_vivants"] = max (pic, compteurs_avant ["pic_noeuds_vivants"])
+        mesures = portees.setdefault (nom, {"executions": 0, "duree": 0.0,
+                                            "compteurs": dict.fromkeys (COMPTEURS, 0), "temps": dict()})
+        mesures ["executions"] += 1
+        mesures ["duree"] += duree
+        for cle in COMPTEURS:
+            if cle == "pic_noeuds_vivants":
+                mesures ["compteurs"] [cle] = max (mesures ["compteurs"] [cle], pic)
+            else:
+                mesures ["compteurs"] [cle] += compteurs [cle] - compteurs_avant [cle]
+        for operation, mesure in temps.items ():
+            avant = temps_avant.get (operation, {"appels": 0, "total": 0.0})
+            if mesure ["appels"] == avant ["appels"]:
+                continue
+            cumul = mesures ["temps"].setdefault (operation, {"appels": 0, "total": 0.0})
+            cumul ["appels"] += mesure ["appels"] - avant ["appels"]
+            cumul ["total"] += mesure ["total"] - avant ["total"]
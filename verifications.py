@@ -0,0 +1,274 @@
+from abd import abd, vue_abd
+from gestionnaire import gestionnaire, FAUX, VRAI
+import argparse
+import gc
+import random
+import sys
+
+# Vérifications du gestionnaire de noeuds par force brute : les échanges de niveaux adjacents
+# (gestionnaire.echanger()), le tamisage (gestionnaire.tamiser()) et le ramasse-miettes
+# (gestionnaire.collecter()) modifient les tableaux sur place ; chaque vérification compare les
+# tables de vérité des ROBDD avant et après, et contrôle que le gestionnaire reste canonique.
+# python verifications.py [--graine N] lève une AssertionError à la première incohérence.
+
+
+def verite (vue, nb_vars):
+    """
+    Calcule la table de vérité d'un ROBDD en le parcourant pour chaque affectation (quel que soit
+    l'ordre des variables de son gestionnaire)
+
+    Parameters
+    ----------
+    vue : vue_abd
+        Le ROBDD.
+    nb_vars : int
+        Le nombre de variables.
+
+    Returns
+    -------
+    int
+        La table de vérité : le bit j est la valeur de la fonction quand x_i vaut le bit i - 1 de j.
+
+    """
+
+    g = vue.gestionnaire
+    res = 0
+    for j in range (2 ** nb_vars):
+        noeud = vue.indice
+        while noeud > 1:
+            variable = g.variable (g.niveaux [noeud])
+            noeud = g.vrai [noeud] if (j >> (variable - 1)) & 1 else g.faux [noeud]
+        if noeud == VRAI:
+            res |= 1 << j
+    return res
+
+def verifier_canonique (g, racines):
+    """
+    Vérifie que les noeuds accessibles depuis des racines forment des ROBDD canoniques : pas de
+    noeud redondant ni de doublon, des fils de niveau inférieur, et chaque noeud retrouvé par la
+    table unique
+
+    Parameters
+    ----------
+    g : gestionnaire
+        Le gestionnaire.
+    racines : list of int
+        Les indices des racines.
+
+    Returns
+    -------
+    int
+        Le nombre de noeuds accessibles (feuilles comprises, cf. tamiser()).
+
+    """
+
+    triplets = dict()
+    vus = set()
+    pile = list (racines)
+    while pile:
+        noeud = pile.pop ()
+        if noeud < 2 or noeud in vus:
+            continue
+        vus.add (noeud)
+        cle = (g.niveaux [noeud], g.faux [noeud], g.vrai [noeud])
+        assert g.faux [noeud] != g.vrai [noeud], ("noeud redondant", noeud)
+        assert cle not in triplets, ("doublon", noeud, triplets.get (cle))
+        triplets [cle] = noeud
+        assert g.niveaux [g.faux [noeud]] < g.niveaux [noeud], ("fils faux mal placé", noeud)
+        assert g.niveaux [g.vrai [noeud]] < g.niveaux [noeud], ("fils vrai mal placé", noeud)
+        assert g.noeud (*cle) == noeud, ("absent de la table unique", noeud)
+        pile.append (g.faux [noeud])
+        pile.append (g.vrai [noeud])
+    return len (vus) + 2
+
+def verifier_echanges (alea, nb_essais=15, nb_echanges=10):
+    """
+    Echange des niveaux adjacents tirés au hasard dans des gestionnaires de trois fonctions
+    aléatoires de 2 à 6 variables, en vérifiant les fonctions après chaque échange
+
+    Parameters
+    ----------
+    alea : random.Random
+        Le générateur aléatoire.
+    nb_essais : int, optional
+        Le nombre de gestionnaires par nombre de variables. 15 par défaut.
+    nb_echanges : int, optional
+        Le nombre d'échanges par gestionnaire. 10 par défaut.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    for nb_vars in range (2, 7):
+        for _ in range (nb_essais):
+            g = gestionnaire ()
+            tables = [alea.getrandbits (2 ** nb_vars) for _ in range (3)]
+            vues = [abd.cons_robdd (x, 2 ** nb_vars, g) for x in tables]
+            references, par_niveau = g.preparer_reordonnancement (list (g.racines))
+            for _ in range (nb_echanges):
+                g.echanger (alea.randint (1, nb_vars - 1), references, par_niveau)
+                assert [verite (vue, nb_vars) for vue in vues] == tables
+                verifier_canonique (g, [vue.indice for vue in vues])
+
+def verifier_tamisage (alea, nb_essais=15):
+    """
+    Tamise des gestionnaires de trois fonctions aléatoires de 2 à 6 variables et vérifie les
+    fonctions, la taille annoncée et les opérations faites après le changement d'ordre ; puis le
+    tamisage d'une fonction dont la taille dépend de l'ordre, et le tamisage automatique
+
+    Parameters
+    ----------
+    alea : random.Random
+        Le générateur aléatoire.
+    nb_essais : int, optional
+        Le nombre de gestionnaires par nombre de variables. 15 par défaut.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    for nb_vars in range (2, 7):
+        nb_feuilles = 2 ** nb_vars
+        affectations = [[(j >> i) & 1 for i in range (nb_vars)] for j in range (nb_feuilles)]
+        for _ in range (nb_essais):
+            g = gestionnaire ()
+            tables = [alea.getrandbits (nb_feuilles) for _ in range (3)]
+            vues = [abd.cons_robdd (x, nb_feuilles, g) for x in tables]
+            tailles = g.tamiser ()
+            assert g.dernier_tamisage == tailles
+            assert [verite (vue, nb_vars) for vue in vues] == tables
+            assert verifier_canonique (g, [vue.indice for vue in vues]) == tailles [1]
+            assert verite (abd.appliquer (vues [0], vues [1], "et"), nb_vars) == tables [0] & tables [1]
+            assert abd.nb_solutions (vues [0], nb_vars) == bin (tables [0]).count ("1")
+            assert abd.nb_solutions (vues [0], nb_vars + 2) == 4 * bin (tables [0]).count ("1")
+            attendu = [bool ((tables [1] >> j) & 1) for j in range (nb_feuilles)]
+            for entier in (False, True):
+                fonction = abd.compiler (vues [1], entier)
+                assert [fonction (x) for x in affectations] == attendu
+            naturel = abd.existe (abd.cons_robdd (tables [2], nb_feuilles), [1, nb_vars])
+            assert verite (abd.existe (vues [2], [1, nb_vars]), nb_vars) == verite (naturel, nb_vars)
+            solutions = sorted (sum (int (valeur) << (i - 1) for i, valeur in solution.items ())
+                                for solution in abd.solutions (vues [0], nb_vars))
+            assert solutions == [j for j in range (nb_feuilles) if (tables [0] >> j) & 1]
+
+    # (x_1 et x_5) ou (x_2 et x_6) ou ... : exponentiel dans l'ordre naturel, linéaire entrelacé
+    k = 4
+    g = gestionnaire ()
+    f = FAUX
+    for i in range (1, k + 1):
+        f = g.appliquer ("ou", f, g.appliquer ("et", g.noeud (i, FAUX, VRAI), g.noeud (i + k, FAUX, VRAI)))
+    vue = vue_abd (g, f)
+    table = verite (vue, 2 * k)
+    avant, apres = abd.tamiser (vue)
+    assert apres < avant
+    assert verite (vue, 2 * k) == table
+    assert verifier_canonique (g, [vue.indice]) == apres
+
+    g = gestionnaire ()
+    g.seuil_tamisage = 200
+    vues = [abd.cons_robdd (alea.getrandbits (256), 256, g) for _ in range (5)]
+    assert g.dernier_tamisage is not None
+    verifier_canonique (g, [vue.indice for vue in vues])
+
+def verifier_ramasse_miettes (alea, nb_tours=400, nb_vars=8):
+    """
+    Construit et combine des fonctions aléatoires dans un gestionnaire qui libère ses noeuds
+    au-delà d'un seuil, en gardant quelques ROBDD ; vérifie les fonctions, les noeuds libérés,
+    la table de calcul et la réutilisation des noeuds libérés
+
+    Parameters
+    ----------
+    alea : random.Random
+        Le générateur aléatoire.
+    nb_tours : int, optional
+        Le nombre de tours. 400 par défaut.
+    nb_vars : int, optional
+        Le nombre de variables des fonctions. 8 par défaut.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    nb_feuilles = 2 ** nb_vars
+    g = gestionnaire ()
+    g.seuil_collecte = 2000
+    gardes = []
+    taille_max = 0
+    for tour in range (nb_tours):
+        x, y = alea.getrandbits (nb_feuilles), alea.getrandbits (nb_feuilles)
+        a = abd.cons_robdd (x, nb_feuilles, g)
+        b = abd.cons_robdd (y, nb_feuilles, g)
+        c = abd.appliquer (a, b, "xor")
+        assert verite (c, nb_vars) == x ^ y
+        assert verite (a, nb_vars) == x
+        abd.existe (c, [3])
+        if tour % 50 == 0:
+            gardes.append ((a, x))
+        del a, b, c
+        taille_max = max (taille_max, len (g.niveaux))
+    # Sans ramasse-miettes, les nb_tours tours alloueraient des dizaines de milliers de noeuds
+    assert taille_max < 5 * 2000, taille_max
+    for vue, x in gardes:
+        assert verite (vue, nb_vars) == x
+
+    gc.collect ()
+    g.collecter ()
+    vivants = [vue.indice for vue, _ in gardes]
+    verifier_canonique (g, vivants)
+    for noeud in g.libres:
+        assert g.faux [noeud] == g.vrai [noeud] == FAUX, ("noeud libre utilisé", noeud)
+    positions = {"ite": (1, 2, 3), "compiler": (1,), "table": ()}
+    for cle, valeur in g.cache.items ():
+        noeuds = [cle [i] for i in positions.get (cle [0], (1, 2))]
+        if isinstance (valeur, int):
+            noeuds.append (valeur)
+        for noeud in noeuds:
+            assert noeud < 2 or g.faux [noeud] != g.vrai [noeud], ("entrée périmée", cle)
+
+    del gardes, vivants
+    gc.collect ()
+    g.collecter ()
+    # Les noeuds libres en fin de tableaux sont rendus, les autres sont réutilisés d'abord
+    fin = len (g.niveaux)
+    assert fin == 2 or g.faux [fin - 1] != g.vrai [fin - 1]
+    x = alea.getrandbits (nb_feuilles)
+    vue = abd.cons_robdd (x, nb_feuilles, g)
+    assert verite (vue, nb_vars) == x
+    assert len (g.niveaux) == fin or not g.libres
+    verifier_canonique (g, [vue.indice])
+
+def main (arguments=None):
+    """
+    Point d'entrée en ligne de commande : python verifications.py [-h] [--graine N]
+
+    Parameters
+    ----------
+    arguments : list of string, optional
+        Les arguments. None par défaut (ceux de la ligne de commande).
+
+    Returns
+    -------
+    int
+        Le code de retour : 0 (une vérification qui échoue lève une AssertionError).
+
+    """
+
+    parseur = argparse.ArgumentParser (description="Vérifie par force brute les échanges, le tamisage et le ramasse-miettes")
+    parseur.add_argument ("--graine", type=int, default=0, help="graine des fonctions tirées (0)")
+    args = parseur.parse_args (arguments)
+
+    alea = random.Random (args.graine)
+    for nom, verification in (("echanges", verifier_echanges), ("tamisage", verifier_tamisage),
+                              ("ramasse-miettes", verifier_ramasse_miettes)):
+        verification (alea)
+        sys.stderr.write (nom + " : ok\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit (main ())